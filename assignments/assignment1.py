@@ -1,4 +1,16 @@
-from math import ceil
+import heapq
+import mmap
+import os
+import re
+import struct
+import threading
+from collections import OrderedDict
+from math import log2
+from multiprocessing import Pool, shared_memory
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 def trainer(wordlist, word, marker):
     """
@@ -110,7 +122,7 @@ def word_sort(list,character,column,location):
 
 def get_words(word,list):
     """
-    Function that returns a list of possible words that could be the correct word by calling the counting_sort function
+    Function that returns a list of possible words that could be the correct word, keeping the anagrams of the word in one pass over the list
     Precondition:
         - All words in the list should be of equal length
         - All characters in the word should be lowercase alphabets
@@ -120,27 +132,65 @@ def get_words(word,list):
         word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
         list: List of N words, where each word is a string of length M, with each character in the range of lowercase {a−z}
     Return:
-        possible_words: list of possible words that coul dbe the correct word
+        possible_words: list of possible words that coul dbe the correct word, in the same order as in list
     Time complexity: 
-        Best: O(N)
+        Best: O(NM)
+        Worst: O(NM)
+    Space complexity: 
+        Input: O(N)
+        Aux: O(X)
+    X -> Number of possible words
+    """
+    signature = letter_signature(word)
+    possible_words = [item for item in list if letter_signature(item) == signature]
+    return possible_words
+
+def anagram_index(list):
+    """
+    Function that groups the positions of the words of a list by their letter signature, so that all anagrams of a word can be found with one lookup
+    Precondition:
+        - All characters in the words should be lowercase alphabets
+    Postcondition:
+        - Each signature is mapped to the positions of its words, in ascending order
+    Input:
+        list: List of N words, where each word is a string of length M, with each character in the range of lowercase {a−z}
+    Return:
+        index: Dictionary mapping the letter signature of a word to the list of positions in list of the words with that signature
+    Time complexity: 
+        Best: O(NM)
         Worst: O(NM)
     Space complexity: 
         Input: O(N)
         Aux: O(N)
     """
-    possible_words = []
+    index = {}
     for i in range(len(list)):
-        sorted_words = counting_sort(list[i])
-        possible_words.append(sorted_words)
-
-    word_sort = counting_sort(word)
-    for i in range(len(possible_words)):
-        possible_words[i] = list[i] if possible_words[i] == word_sort else ""
-        # looping through the possible_words list to remove occurrences of ""
-    for item in possible_words:
-        if item == "":
-            possible_words.remove(item)
-    return possible_words
+        signature = letter_signature(list[i])
+        if signature in index:
+            index[signature].append(i)
+        else:
+            index[signature] = [i]
+    return index
+
+def letter_signature(word):
+    """
+    Function that counts how many times each letter appears in a word, which is the same for all anagrams of the word
+    Input:
+        word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+    Return:
+        signature: Tuple of 26 integers, where signature[i] is the number of times the i-th letter of the alphabet appears in word
+    Time complexity: 
+        Best: O(M)
+        Worst: O(M)
+    Space complexity: 
+        Input: O(M)
+        Aux: O(1)
+    M -> Length of word
+    """
+    count = [0] * 26
+    for x in word:
+        count[ord(x)-97] += 1
+    return tuple(count)
 
 def counting_sort(word):
     """
@@ -169,132 +219,1824 @@ def counting_sort(word):
             count[i] -= 1
     return sorted_word
 
-def local_maximum(M):
+def make_bitset(numbers, size):
+    """
+    Function to build a bitset from the numbers of its set bits, writing them into a byte array that is converted once
+    Input:
+        numbers: List of K distinct integers in the range [0, size)
+        size: Number of bits N of the bitset
+    Return:
+        bitset: Integer where bit i is set if i is in numbers
+    Time complexity:
+        Best: O(N/w + K)
+        Worst: O(N/w + K)
+    Space complexity:
+        Input: O(K)
+        Aux: O(N/w)
+    w -> Number of bits in a machine word
+    """
+    if not numbers:
+        return 0
+    data = bytearray((size + 7) // 8)
+    for i in numbers:
+        data[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(data, "little")
+
+class WordIndex:
+    """
+    Precompiled index over a word list, used to answer many trainer queries against the same dictionary
+    """
+    def __init__(self, wordlist):
+        """
+        Function to build the index from a word list
+        Precondition:
+            - All words in the list are of same length
+            - There are no duplicate words in the list
+        Input:
+            - self: Instance of the WordIndex class
+            - wordlist: List of N words, where each word is a string of length M, with each character in the range of lowercase {a−z}
+        Returns:
+            - None
+        Time complexity:
+            Best: O(NlogN + NM)
+            Worst: O(NlogN + NM)
+        Space complexity:
+            Input: O(N)
+            Aux: O(NM)
+        """
+        # words are kept in lexicographical order so that the bit of a word matches its position in the trainer output
+        self.words = sorted(wordlist)
+        self.length = len(self.words[0]) if self.words else 0
+        self.all_words = (1 << len(self.words)) - 1
+        # the word numbers of every bitset are gathered first, since or-ing bits into a growing int one at a time copies it every time
+        columns = [[[] for _ in range(26)] for _ in range(self.length)]
+        for i in range(len(self.words)):
+            for column in range(self.length):
+                columns[column][ord(self.words[i][column]) - 97].append(i)
+        # positions[column][letter] is a bitset of the words that have the letter in that column
+        self.positions = [[make_bitset(numbers, len(self.words)) for numbers in letters] for letters in columns]
+        # signatures maps the letter signature of a word to the ascending word numbers of all of its anagrams in the list,
+        # kept as a list rather than a bitset so that the many small anagram groups take O(N) space in total, not O(N^2/w)
+        self.signatures = anagram_index(self.words)
+
+    def __len__(self):
+        """
+        Returns the number of words in the index
+        Input:
+            - self: Instance of the WordIndex class
+        Returns:
+            - Number of words in the index
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        return len(self.words)
+
+    def match(self, word, marker):
+        """
+        Function to find the bitset of words that are possible matches for a guess
+        Input:
+            - self: Instance of the WordIndex class
+            - word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+            - marker: Array of integers of length M. Each element is in the range {0, 1}, and is used to mark the characters in the guessed word
+        Returns:
+            - matches: Bitset where bit i is set if self.words[i] is a possible match
+        Time complexity:
+            Best: O(M)
+            Worst: O(MN/w + K)
+        Space complexity:
+            Input: O(M)
+            Aux: O(N/w)
+        w -> Number of bits in a machine word
+        K -> Number of anagrams of the guess in the list
+        """
+        anagrams = self.signatures.get(letter_signature(word))
+        if anagrams is None:
+            return 0
+        matches = make_bitset(anagrams, len(self.words))
+        column = 0
+        while matches and column < self.length:
+            letter = self.positions[column][ord(word[column]) - 97]
+            # keep the words that have the letter in that column if it is marked, else the words that do not
+            if marker[column] == 1:
+                matches &= letter
+            else:
+                matches &= self.all_words ^ letter
+            column = column + 1
+        return matches
+
+    def words_of(self, matches):
+        """
+        Function to convert a bitset returned by match into the list of words it contains
+        Input:
+            - self: Instance of the WordIndex class
+            - matches: Bitset of word positions
+        Returns:
+            - word_matches: List of words in lexicographical order
+        Time complexity:
+            Best: O(1)
+            Worst: O(XN/w)
+        Space complexity:
+            Input: O(N/w)
+            Aux: O(X)
+        X -> Number of words in the bitset
+        """
+        word_matches = []
+        while matches:
+            lowest = matches & -matches
+            word_matches.append(self.words[lowest.bit_length() - 1])
+            matches ^= lowest
+        return word_matches
+
+    def trainer(self, word, marker):
+        """
+        Function that returns the same possible word matches as trainer, without rebuilding the word list
+        Input:
+            - self: Instance of the WordIndex class
+            - word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+            - marker: Array of integers of length M. Each element is in the range {0, 1}, and is used to mark the characters in the guessed word
+        Returns:
+            - word_matches: A list of strings containing the valid words in lexicographical order
+        Time complexity:
+            Best: O(M)
+            Worst: O(MN/w + XN/w)
+        Space complexity:
+            Input: O(M)
+            Aux: O(X + N/w)
+        """
+        return self.words_of(self.match(word, marker))
+
+class NumpyWordIndex:
+    """
+    Vectorised index over a word list, which encodes every word once so that trainer queries become NumPy array comparisons
+    """
+    def __init__(self, wordlist):
+        """
+        Function to encode the word list as a matrix of letters and a matrix of letter counts
+        Precondition:
+            - NumPy is installed
+            - All words in the list are of same length
+            - There are no duplicate words in the list
+        Input:
+            - self: Instance of the NumpyWordIndex class
+            - wordlist: List of N words, where each word is a string of length M, with each character in the range of lowercase {a−z}
+        Returns:
+            - None
+        Time complexity:
+            Best: O(NM)
+            Worst: O(NlogN + NM)
+        Space complexity:
+            Input: O(N)
+            Aux: O(NM)
+        """
+        if np is None:
+            raise ImportError("NumpyWordIndex requires numpy")
+        # words are kept in lexicographical order so that the results come out in the same order as trainer
+        self.words = sorted(wordlist)
+        self.length = len(self.words[0]) if self.words else 0
+        # letters[i][j] is the letter in column j of word i, where a is 0 and z is 25
+        # it is stored column by column so that each positional check reads one contiguous column
+        letters = np.frombuffer("".join(self.words).encode("ascii"), dtype=np.uint8)
+        self.letters = np.asfortranarray(letters.reshape(len(self.words), self.length) - 97)
+        # counts[i] holds the number of times each letter appears in word i
+        # rows are padded to 32 bytes so that each one can be compared as 4 unsigned 64 bit integers
+        counts = np.zeros((len(self.words), 32), dtype=np.uint8)
+        rows = np.arange(len(self.words))
+        for column in range(self.length):
+            counts[rows, self.letters[:, column]] += 1
+        self.signatures = counts.view(np.uint64)
+
+    def __len__(self):
+        """
+        Returns the number of words in the index
+        Input:
+            - self: Instance of the NumpyWordIndex class
+        Returns:
+            - Number of words in the index
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        return len(self.words)
+
+    def match(self, word, marker):
+        """
+        Function to find which words are possible matches for a guess
+        Input:
+            - self: Instance of the NumpyWordIndex class
+            - word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+            - marker: Array of integers of length M. Each element is in the range {0, 1}, and is used to mark the characters in the guessed word
+        Returns:
+            - matches: Sorted array of the positions in self.words of the possible matches
+        Time complexity:
+            Best: O(N)
+            Worst: O(NM)
+        Space complexity:
+            Input: O(M)
+            Aux: O(N)
+        """
+        guess = np.frombuffer(word.encode("ascii"), dtype=np.uint8) - 97
+        counts = np.zeros(32, dtype=np.uint8)
+        counts[:26] = np.bincount(guess, minlength=26)
+        signature = counts.view(np.uint64)
+
+        # marked columns are checked first since they remove the most words, then only the survivors are compared further
+        columns = sorted(range(self.length), key=lambda column: marker[column] != 1)
+        matches = None
+        for column in columns:
+            if marker[column] != 1:
+                break
+            if matches is None:
+                matches = np.flatnonzero(self.letters[:, column] == guess[column])
+            else:
+                matches = matches[self.letters[matches, column] == guess[column]]
+        if matches is None:
+            matches = np.flatnonzero((self.signatures == signature).all(axis=1))
+        else:
+            matches = matches[(self.signatures[matches] == signature).all(axis=1)]
+        for column in columns:
+            if marker[column] == 1:
+                continue
+            matches = matches[self.letters[matches, column] != guess[column]]
+        return matches
+
+    def trainer(self, word, marker):
+        """
+        Function that returns the same possible word matches as trainer
+        Input:
+            - self: Instance of the NumpyWordIndex class
+            - word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+            - marker: Array of integers of length M. Each element is in the range {0, 1}, and is used to mark the characters in the guessed word
+        Returns:
+            - word_matches: A list of strings containing the valid words in lexicographical order
+        Time complexity:
+            Best: O(NM)
+            Worst: O(NM)
+        Space complexity:
+            Input: O(M)
+            Aux: O(NM)
+        """
+        return [self.words[i] for i in self.match(word, marker)]
+
+class TrainerSession:
+    """
+    Stateful session that narrows the possible word matches with each new guess, instead of starting from the full word list
+    """
+    def __init__(self, wordlist):
+        """
+        Function to start a session from a word list
+        Precondition:
+            - All words in the list are of same length
+            - There are no duplicate words in the list
+        Input:
+            - self: Instance of the TrainerSession class
+            - wordlist: List of N words, where each word is a string of length M, with each character in the range of lowercase {a−z}
+        Returns:
+            - None
+        Time complexity:
+            Best: O(N)
+            Worst: O(N)
+        Space complexity:
+            Input: O(N)
+            Aux: O(N)
+        """
+        # the session works on its own copy since word_sort narrows the list in place
+        self.candidates = list(wordlist)
+        self.history = []
+
+    def __len__(self):
+        """
+        Returns the number of surviving candidates
+        Input:
+            - self: Instance of the TrainerSession class
+        Returns:
+            - Number of words that are still possible matches
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        return len(self.candidates)
+
+    def guess(self, word, marker):
+        """
+        Function to narrow the surviving candidates with a new guess
+        Postcondition:
+            - self.candidates only holds the words that match every guess so far, in lexicographical order
+        Input:
+            - self: Instance of the TrainerSession class
+            - word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+            - marker: Array of integers of length M. Each element is in the range {0, 1}, and is used to mark the characters in the guessed word
+        Returns:
+            - pruned: Number of candidates removed by this guess
+        Time complexity:
+            Best: O(M)
+            Worst: O(SM)
+        Space complexity:
+            Input: O(M)
+            Aux: O(S)
+        S -> Number of surviving candidates before the guess
+        """
+        before = len(self.candidates)
+        for i in range(len(word) - 1, -1, -1):
+            if not self.candidates:
+                break
+            word_sort(self.candidates, word[i], i, marker[i] == 1)
+
+        # keeping only the anagrams of the guessed word, without building a new list
+        word_signature = letter_signature(word)
+        index = 0
+        for candidate in self.candidates:
+            if letter_signature(candidate) == word_signature:
+                self.candidates[index] = candidate
+                index = index + 1
+        del self.candidates[index:]
+
+        pruned = before - len(self.candidates)
+        self.history.append((word, list(marker), pruned, len(self.candidates)))
+        return pruned
+
+    def pruned(self):
+        """
+        Returns the number of candidates removed at each step of the session
+        Input:
+            - self: Instance of the TrainerSession class
+        Returns:
+            - List with the number of pruned candidates for each guess, in the order the guesses were made
+        Time complexity:
+            Best: O(1)
+            Worst: O(K)
+        Space complexity:
+            Input: O(1)
+            Aux: O(K)
+        K -> Number of guesses made
+        """
+        return [step[2] for step in self.history]
+
+# Header of a word store file: magic, number of words, length of each word, padding, and a newline so that the first record starts a line
+WORD_STORE_MAGIC = b"WORDSTR1"
+WORD_STORE_HEADER = struct.Struct("<8sQI11xc")
+
+def write_word_store(path, wordlist):
+    """
+    Function that writes a word list to a packed word store file, which can be opened with WordStore
+    Precondition:
+        - All words in the list are of same length
+        - There are no duplicate words in the list
+    Postcondition:
+        - The file holds a header followed by one fixed width record of M + 1 bytes per word, in lexicographical order
+    Input:
+        path: Path of the file to write
+        wordlist: List of N words, where each word is a string of length M, with each character in the range of lowercase {a−z}
+    Return:
+        None
+    Time complexity: 
+        Best: O(NM)
+        Worst: O(NlogN + NM)
+    Space complexity: 
+        Input: O(N)
+        Aux: O(N)
+    """
+    words = sorted(wordlist)
+    length = len(words[0]) if words else 0
+    with open(path, "wb") as file:
+        file.write(WORD_STORE_HEADER.pack(WORD_STORE_MAGIC, len(words), length, b"\n"))
+        for item in words:
+            # each record ends with a newline, so records stay aligned and the file is also a plain word list after the header
+            file.write(item.encode("ascii") + b"\n")
+
+class WordStore:
+    """
+    Read only view of a word store file through a memory map, which is filtered without building a list of all the words
+    """
+    def __init__(self, path):
+        """
+        Function to open and memory map a word store file
+        Input:
+            - self: Instance of the WordStore class
+            - path: Path of a file written by write_word_store
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.length, _ = WORD_STORE_HEADER.unpack_from(self.data)
+        if magic != WORD_STORE_MAGIC:
+            self.data.close()
+            raise ValueError(f"{path} is not a word store file")
+        self.record = self.length + 1
+
+    def __len__(self):
+        """
+        Returns the number of words in the store
+        Input:
+            - self: Instance of the WordStore class
+        Returns:
+            - Number of words in the store
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        return self.count
+
+    def __getitem__(self, i):
+        """
+        Returns the word at a position of the store
+        Input:
+            - self: Instance of the WordStore class
+            - i: Position of the word, where 0 <= i < N
+        Returns:
+            - The i-th word in lexicographical order
+        Time complexity:
+            Best: O(M)
+            Worst: O(M)
+        Space complexity:
+            Input: O(1)
+            Aux: O(M)
+        """
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        start = WORD_STORE_HEADER.size + i * self.record
+        return self.data[start:start + self.length].decode("ascii")
+
+    def __enter__(self):
+        """
+        Returns the store itself, so that it can be used in a with statement
+        Input:
+            - self: Instance of the WordStore class
+        Returns:
+            - self
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Closes the store at the end of a with statement
+        Input:
+            - self: Instance of the WordStore class
+        Returns:
+            - None
+        """
+        self.close()
+
+    def close(self):
+        """
+        Function to release the memory map
+        Input:
+            - self: Instance of the WordStore class
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        self.data.close()
+
+    def trainer(self, word, marker):
+        """
+        Function that returns the same possible word matches as trainer, reading the words directly from the memory map
+        Input:
+            - self: Instance of the WordStore class
+            - word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+            - marker: Array of integers of length M. Each element is in the range {0, 1}, and is used to mark the characters in the guessed word
+        Returns:
+            - word_matches: A list of strings containing the valid words in lexicographical order
+        Time complexity:
+            Best: O(NM)
+            Worst: O(NM)
+        Space complexity:
+            Input: O(M)
+            Aux: O(YM)
+        Y -> Number of words that pass the positional check
+        """
+        # each column becomes either the guessed letter or a class of the other letters of the guess, anchored to a whole record
+        # an anagram can only use letters of the guess, so other letters are ruled out before any record is decoded
+        letters = set(word.encode("ascii"))
+        pattern = b""
+        for i in range(len(word)):
+            if marker[i] == 1:
+                pattern += word[i].encode("ascii")
+            elif len(letters) == 1:
+                return []
+            else:
+                pattern += b"[" + bytes(sorted(letters - {ord(word[i])})) + b"]"
+        pattern = re.compile(b"^" + pattern + b"$", re.MULTILINE)
+
+        # only the records passing the positional check are decoded, then get_words checks the anagrams
+        positional = [match.group().decode("ascii") for match in pattern.finditer(self.data, WORD_STORE_HEADER.size)]
+        return get_words(word, positional)
+
+def wordlist_fingerprint(wordlist):
+    """
+    Function that returns a fingerprint of a word list, which changes whenever a word is added, removed, replaced or moved
+    Input:
+        wordlist: List of N words
+    Return:
+        fingerprint: Pair of the number of words and a hash of the words
+    Time complexity: 
+        Best: O(N)
+        Worst: O(NM)
+    Space complexity: 
+        Input: O(N)
+        Aux: O(N)
+    """
+    return (len(wordlist), hash(tuple(wordlist)))
+
+class TrainerCache:
+    """
+    Bounded, thread safe least recently used cache of trainer results for one version of a word list, keyed on the query.
+    The cache is emptied whenever it is asked about another version of the word list
+    """
+    def __init__(self, maxsize=1024, max_words=None):
+        """
+        Function to initialise an empty cache
+        Input:
+            - self: Instance of the TrainerCache class
+            - maxsize: Maximum number of cached queries
+            - max_words: Maximum total number of words in the cached results, or None for no limit
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        self.maxsize = maxsize
+        self.max_words = max_words
+        self.entries = OrderedDict()
+        self.version = None
+        self.words = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Returns the number of cached queries
+        Input:
+            - self: Instance of the TrainerCache class
+        Returns:
+            - Number of cached queries
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        return len(self.entries)
+
+    def trainer(self, wordlist, word, marker, version=None):
+        """
+        Function that returns the same possible word matches as trainer, reusing the result of an earlier identical query
+        Postcondition:
+            - wordlist is not modified
+            - Results computed for an earlier version of the word list are never returned, since the cache is emptied when the version changes
+        Input:
+            - self: Instance of the TrainerCache class
+            - wordlist: List of N words, where each word is a string of length M, with each character in the range of lowercase {a−z}
+            - word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+            - marker: Array of integers of length M. Each element is in the range {0, 1}, and is used to mark the characters in the guessed word
+            - version: Hashable version of the word list, which the caller changes whenever the list changes.
+              If None, the fingerprint of the list is used as its version, which costs O(N) on every call
+        Returns:
+            - word_matches: A list of strings containing the valid words, based on the input provided
+        Time complexity:
+            Best: O(M + X) for a hit with a version
+            Worst: O(NM)
+        Space complexity:
+            Input: O(N)
+            Aux: O(N + X)
+        """
+        if version is None:
+            version = wordlist_fingerprint(wordlist)
+        key = (word, tuple(marker))
+        with self.lock:
+            if version != self.version:
+                if self.entries:
+                    self.invalidations += 1
+                self.entries.clear()
+                self.words = 0
+                self.version = version
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return list(self.entries[key])
+            self.misses += 1
+
+        # trainer narrows its list in place, so it is given a copy
+        word_matches = trainer(list(wordlist), word, marker)
+
+        with self.lock:
+            # another thread may have moved the cache to a newer version while the query ran
+            if version == self.version and key not in self.entries:
+                self.entries[key] = word_matches
+                self.words += len(word_matches)
+                while self.entries and (len(self.entries) > self.maxsize or
+                                        self.max_words is not None and self.words > self.max_words):
+                    _, evicted = self.entries.popitem(last=False)
+                    self.words -= len(evicted)
+                    self.evictions += 1
+        return list(word_matches)
+
+    def clear(self):
+        """
+        Function to remove every cached query, keeping the counters
+        Input:
+            - self: Instance of the TrainerCache class
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(K)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        K -> Number of cached queries
+        """
+        with self.lock:
+            self.entries.clear()
+            self.words = 0
+
+    def stats(self):
+        """
+        Returns the counters of the cache
+        Input:
+            - self: Instance of the TrainerCache class
+        Returns:
+            - Dictionary with the number of hits, misses, evictions, version changes that emptied the cache, cached queries and cached words
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "invalidations": self.invalidations, "size": len(self.entries), "words": self.words}
+
+def trainer_stream(source, word, marker, chunk_size=4096):
+    """
+    Function that filters a word list as it is read, chunk by chunk, using the same rules as trainer
+    Precondition:
+        - There are no duplicate words in the source
+    Postcondition:
+        - At most chunk_size words of the source are held in memory at once
+    Input:
+        source: Path of a file with one word per line, or any iterable of words. Words of a different length than word are skipped
+        word: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+        marker: Array of integers of length M. Each element is in the range {0, 1}, and is used to mark the characters in the guessed word
+        chunk_size: Number of words filtered together
+    Return:
+        Generator of the possible word matches. Matches of each chunk are in lexicographical order, so a sorted source gives sorted matches
+    Time complexity: 
+        Best: O(NM)
+        Worst: O(NM)
+    Space complexity: 
+        Input: O(M)
+        Aux: O(CM)
+    C -> chunk_size
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source) as file:
+            yield from trainer_stream((line.strip() for line in file), word, marker, chunk_size)
+        return
+
+    chunk = []
+    for item in source:
+        if len(item) != len(word):
+            continue
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield from trainer(chunk, word, marker)
+            chunk = []
+    if chunk:
+        yield from trainer(chunk, word, marker)
+
+# WordIndex of a worker process in trainer_batch, built once from the shared dictionary
+batch_index = None
+
+def trainer_batch(wordlist, queries, workers=None):
+    """
+    Function that answers many trainer queries against the same word list, spreading them over a pool of worker processes
+    Precondition:
+        - All words in the list are of same length
+        - There are no duplicate words in the list
+    Postcondition:
+        - wordlist is not modified
+    Input:
+        wordlist: List of N words, where each word is a string of length M, with each character in the range of lowercase {a−z}
+        queries: List of Q (word, marker) pairs, in the same format as the word and marker arguments of trainer
+        workers: Number of worker processes, defaults to the number of cores. With 1 worker the queries are answered in this process
+    Return:
+        results: List of Q lists of possible word matches, where results[i] is the answer to queries[i]
+    Time complexity: 
+        Best: O(NM + Q)
+        Worst: O(NM + QMN/w/P)
+    Space complexity: 
+        Input: O(N + QM)
+        Aux: O(PNM + QX)
+    P -> Number of worker processes
+    w -> Number of bits in a machine word
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(queries))
+    if workers <= 1 or not wordlist:
+        index = WordIndex(wordlist)
+        return [index.trainer(word, marker) for word, marker in queries]
+
+    # the words are packed once into shared memory as fixed width records, instead of pickling the list to every worker
+    encoded = "".join(wordlist).encode("ascii")
+    memory = shared_memory.SharedMemory(create=True, size=len(encoded))
+    try:
+        memory.buf[:len(encoded)] = encoded
+        chunk_size = max(1, len(queries) // (workers * 4))
+        with Pool(workers, initializer=batch_worker_start, initargs=(memory.name, len(wordlist), len(wordlist[0]))) as pool:
+            results = pool.map(batch_worker_query, queries, chunk_size)
+    finally:
+        memory.close()
+        memory.unlink()
+    return results
+
+def batch_worker_start(name, count, length):
+    """
+    Function run once in each worker process of trainer_batch to build its index from the shared dictionary
+    Input:
+        name: Name of the shared memory block holding the packed words
+        count: Number of words in the block
+        length: Length of each word
+    Return:
+        None
+    Time complexity: 
+        Best: O(NM)
+        Worst: O(NM)
+    Space complexity: 
+        Input: O(1)
+        Aux: O(NM)
+    """
+    global batch_index
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        encoded = bytes(memory.buf[:count * length]).decode("ascii")
+    finally:
+        memory.close()
+    batch_index = WordIndex([encoded[i:i + length] for i in range(0, count * length, length)])
+
+def batch_worker_query(query):
+    """
+    Function run in a worker process of trainer_batch to answer one query
+    Input:
+        query: A (word, marker) pair
+    Return:
+        List of possible word matches for the query
+    Time complexity: 
+        Best: O(M)
+        Worst: O(MN/w + XN/w)
+    Space complexity: 
+        Input: O(M)
+        Aux: O(X + N/w)
+    """
+    word, marker = query
+    return batch_index.trainer(word, marker)
+
+def feedback(guess, answer):
+    """
+    Function that returns the marker a guess would receive if answer was the correct word, packed into one integer
+    Precondition:
+        - guess and answer are of equal length
+    Input:
+        guess: Word which you have guessed.It is a string of length M , with each character in the range of lowercase {a − z}
+        answer: Word assumed to be the correct word, of length M
+    Return:
+        pattern: -1 if answer is not an anagram of guess, since trainer rejects it for any marker. Otherwise bit i is set when marker[i] would be 1
+    Time complexity: 
+        Best: O(M)
+        Worst: O(M)
+    Space complexity: 
+        Input: O(M)
+        Aux: O(1)
+    """
+    if letter_signature(guess) != letter_signature(answer):
+        return -1
+    pattern = 0
+    for i in range(len(guess)):
+        if guess[i] == answer[i]:
+            pattern |= 1 << i
+    return pattern
+
+class GuessRanker:
+    """
+    Engine that ranks guesses by how well the feedback they receive splits a set of candidate answers
+    """
+    def __init__(self, guesses, answers):
+        """
+        Function to set up the ranker for a list of allowed guesses and a list of possible answers
+        Precondition:
+            - All words are of same length
+            - There are no duplicate words in either list
+        Input:
+            - self: Instance of the GuessRanker class
+            - guesses: List of G words that may be guessed
+            - answers: List of A words that may be the correct word
+        Returns:
+            - None
+        Time complexity:
+            Best: O(AM)
+            Worst: O(AM)
+        Space complexity:
+            Input: O(G + A)
+            Aux: O(A)
+        """
+        self.guesses = list(guesses)
+        self.answers = list(answers)
+        self.position = {}
+        for i in range(len(self.answers)):
+            self.position[self.answers[i]] = i
+        # answers grouped by letter signature, since only anagrams of a guess get a pattern other than -1
+        self.anagrams = anagram_index(self.answers)
+        # table maps a guess to its row of the guess x answer feedback table, holding only the entries that are not -1
+        self.table = {}
+
+    def patterns(self, guess):
+        """
+        Function that returns the row of the feedback table of a guess, computing it on first use
+        Input:
+            - self: Instance of the GuessRanker class
+            - guess: Word which you have guessed
+        Returns:
+            - row: Dictionary mapping the position of each answer that is an anagram of guess to its feedback pattern
+        Time complexity:
+            Best: O(1)
+            Worst: O(M + YM)
+        Space complexity:
+            Input: O(M)
+            Aux: O(Y)
+        Y -> Number of answers that are anagrams of guess
+        """
+        if guess not in self.table:
+            self.table[guess] = feedback_row(guess, self.answers, self.anagrams)
+        return self.table[guess]
+
+    def build(self, workers=None):
+        """
+        Function to compute the feedback table rows of every guess up front, optionally over a pool of worker processes
+        Input:
+            - self: Instance of the GuessRanker class
+            - workers: Number of worker processes, defaults to the number of cores. With 1 worker the rows are computed in this process
+        Returns:
+            - None
+        Time complexity:
+            Best: O(GM)
+            Worst: O(GM + GYM/P)
+        Space complexity:
+            Input: O(1)
+            Aux: O(GY)
+        P -> Number of worker processes
+        """
+        missing = [guess for guess in self.guesses if guess not in self.table]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(missing))
+        if workers <= 1:
+            for guess in missing:
+                self.patterns(guess)
+            return
+        chunk_size = max(1, len(missing) // (workers * 4))
+        with Pool(workers, initializer=ranker_worker_start, initargs=(self.answers, self.anagrams)) as pool:
+            rows = pool.map(ranker_worker_row, missing, chunk_size)
+        for i in range(len(missing)):
+            self.table[missing[i]] = rows[i]
+
+    def score(self, guess, candidates=None, metric="entropy"):
+        """
+        Function that scores a guess against the remaining candidates
+        Input:
+            - self: Instance of the GuessRanker class
+            - guess: Word which you have guessed
+            - candidates: Set of positions in self.answers of the remaining candidates, defaults to every answer
+            - metric: "entropy" for the entropy in bits of the partition (higher is better),
+              or "expected_size" for the expected number of candidates left after the guess (lower is better)
+        Returns:
+            - The score of the guess
+        Time complexity:
+            Best: O(Y)
+            Worst: O(Y)
+        Space complexity:
+            Input: O(1)
+            Aux: O(Y)
+        """
+        total = len(self.answers) if candidates is None else len(candidates)
+        if total == 0:
+            return 0.0
+        counts = {}
+        for answer, pattern in self.patterns(guess).items():
+            if candidates is None or answer in candidates:
+                counts[pattern] = counts.get(pattern, 0) + 1
+        # every other candidate is not an anagram of the guess and falls in the -1 part
+        counts[-1] = total - sum(counts.values())
+
+        if metric == "entropy":
+            return -sum(count / total * log2(count / total) for count in counts.values() if count)
+        elif metric == "expected_size":
+            return sum(count * count for count in counts.values()) / total
+        raise ValueError(f"unknown metric {metric}")
+
+    def rank(self, candidates=None, metric="entropy", workers=1):
+        """
+        Function that ranks every guess against the remaining candidates, best guess first
+        Input:
+            - self: Instance of the GuessRanker class
+            - candidates: List of the remaining candidate words, defaults to every answer
+            - metric: "entropy" or "expected_size", as in score
+            - workers: Number of worker processes used to build missing rows of the feedback table
+        Returns:
+            - ranking: List of (guess, score) pairs, best guess first
+        Time complexity:
+            Best: O(GY + GlogG)
+            Worst: O(GM + GYM + GlogG)
+        Space complexity:
+            Input: O(C)
+            Aux: O(G + C)
+        C -> Number of candidates
+        """
+        self.build(workers)
+        if candidates is not None:
+            candidates = {self.position[word] for word in candidates}
+        ranking = [(guess, self.score(guess, candidates, metric)) for guess in self.guesses]
+        ranking.sort(key=lambda item: item[1], reverse=metric == "entropy")
+        return ranking
+
+def feedback_row(guess, answers, anagrams):
+    """
+    Function that computes the row of the feedback table of a guess
+    Input:
+        guess: Word which you have guessed
+        answers: List of A possible answers
+        anagrams: Dictionary mapping a letter signature to the positions of the answers with that signature
+    Return:
+        row: Dictionary mapping the position of each answer that is an anagram of guess to its feedback pattern
+    Time complexity: 
+        Best: O(M)
+        Worst: O(M + YM)
+    Space complexity: 
+        Input: O(A)
+        Aux: O(Y)
     """
-    Function to find index of local maximum of a grid of n-by-n grid of distinct numbers
+    row = {}
+    for i in anagrams.get(letter_signature(guess), []):
+        pattern = 0
+        for j in range(len(guess)):
+            if guess[j] == answers[i][j]:
+                pattern |= 1 << j
+        row[i] = pattern
+    return row
+
+# Answers of a worker process in GuessRanker.build
+ranker_answers = None
+
+def ranker_worker_start(answers, anagrams):
+    """
+    Function run once in each worker process of GuessRanker.build to keep the answers
+    Input:
+        answers: List of A possible answers
+        anagrams: Dictionary mapping a letter signature to the positions of the answers with that signature
+    Return:
+        None
+    Time complexity: 
+        Best: O(1)
+        Worst: O(1)
+    Space complexity: 
+        Input: O(A)
+        Aux: O(1)
+    """
+    global ranker_answers
+    ranker_answers = (answers, anagrams)
+
+def ranker_worker_row(guess):
+    """
+    Function run in a worker process of GuessRanker.build to compute the row of one guess
+    Input:
+        guess: Word which you have guessed
+    Return:
+        The row of the feedback table of guess, as returned by feedback_row
+    Time complexity: 
+        Best: O(M)
+        Worst: O(M + YM)
+    Space complexity: 
+        Input: O(M)
+        Aux: O(Y)
+    """
+    return feedback_row(guess, *ranker_answers)
+
+def local_maximum(M, shape=None):
+    """
+    Function to find index of local maximum of a grid of numbers
     Precondition:
-        - Matrix has equal number of rows and columns
+        - Every row of the matrix has the same number of columns
     Postcondition:
         - Index of local maximum is returned
     Input:
-        M: n-by-n grid of distinct integers (i.e., an n-by-n matrix)
+        M: n-by-m grid of integers (i.e., an n-by-m matrix). It can be a list of rows, a 2-D NumPy array,
+           or any object supporting the buffer protocol, such as array.array or memoryview. Arrays and buffers are not copied
+        shape: (n, m) shape used to view a 1-D buffer such as array.array as a row-major matrix
     Return: 
         index: index of the local maximum
     Time complexity: 
-        Best: O(N)
-        Worst: O(N)
+        Best: O(1)
+        Worst: O(N + M)
     Space complexity: 
-        Input: O(N)
-        Aux: O(N/2)
+        Input: O(NM)
+        Aux: O(1)
     """
-    # finding number of rows and columns in the matrix
-    rows = len(M[:])
-    columns = len(M[:][0])
+    grid = as_matrix_view(M, shape)
     answer = []
     # if the matrix is not empty, we calculate the local maximum
-    if rows and columns != 0:
-        local_max = local_max_recursion(M, rows, columns, columns // 2)
-        index = index_2d(M,local_max)
-        answer.append(index)
+    if grid.rows and grid.columns != 0:
+        answer.append(peak_search(grid))
     # else we return an empty array
     else:
         answer.append([])
     return answer
 
-def findMax(M, rows, middle,max):
+def as_matrix_view(M, shape=None):
     """
-    Function to find the maximum value in the middle column
-    Precondition:
-        - Matrix has equal number of rows and columns
-    Postcondition:
-        - Maximum value in the middle column is returned
+    Function to wrap a matrix in the view matching its type, without copying it
     Input:
-        M: n-by-n grid of distinct integers (i.e., an n-by-n matrix)
-        rows: Number of rows in matrix
-        columns: Number of columns in matrix
-        middle: Middle column of matrix
-        max: Maximum value in column
+        M: n-by-m grid given as a list of rows, a NumPy array or an object supporting the buffer protocol
+        shape: (n, m) shape used to view a 1-D array or buffer as a row-major matrix
     Return: 
-        index: index of the maximum value
-        max: maximum value in column
+        grid: MatrixView, NumpyMatrixView or BufferMatrixView of M
     Time complexity: 
-        Best: O(N)
-        Worst: O(N)
+        Best: O(1)
+        Worst: O(1)
     Space complexity: 
-        Input: O(N^2)
-        Aux: O(N/2)
-    """
-    maximum_index = 0
-    for i in range(rows):
-        if (max < M[i][middle]):
-            # Finding the value of global maximum and its index so that we can check its neighbours
-            max = M[i][middle]
-            maximum_index = i
-    return max,maximum_index
- 
-def local_max_recursion(M, rows, columns,middle):
-    """
-    Function to find the peak element using recursion
+        Input: O(NM)
+        Aux: O(1)
+    """
+    if np is not None and isinstance(M, np.ndarray):
+        return NumpyMatrixView(M, shape)
+    try:
+        view = memoryview(M)
+    except TypeError:
+        return MatrixView(M)
+    return BufferMatrixView(view, shape)
+
+class MatrixView:
+    """
+    Read only view of a matrix given as a list of rows, used by the peak search to read values and scan lines
+    """
+    def __init__(self, M):
+        """
+        Function to initialise the view
+        Input:
+            - self: Instance of the MatrixView class
+            - M: n-by-m grid given as a list of rows
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(NM)
+            Aux: O(1)
+        """
+        self.data = M
+        self.rows = len(M)
+        self.columns = len(M[0]) if self.rows != 0 else 0
+
+    def value(self, row, column):
+        """
+        Returns the value of a cell
+        Input:
+            - self: Instance of the MatrixView class
+            - row: Row of the cell
+            - column: Column of the cell
+        Returns:
+            - Value of the cell
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        return self.data[row][column]
+
+    def column_max(self, column, top, bottom):
+        """
+        Returns the row of the first maximum of a column, between two rows
+        Input:
+            - self: Instance of the MatrixView class
+            - column: Column to scan
+            - top: First row to scan
+            - bottom: Last row to scan
+        Returns:
+            - Row of the maximum
+        Time complexity:
+            Best: O(N)
+            Worst: O(N)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        row = top
+        for i in range(top + 1, bottom + 1):
+            if self.data[i][column] > self.data[row][column]:
+                row = i
+        return row
+
+    def row_max(self, row, left, right):
+        """
+        Returns the column of the first maximum of a row, between two columns
+        Input:
+            - self: Instance of the MatrixView class
+            - row: Row to scan
+            - left: First column to scan
+            - right: Last column to scan
+        Returns:
+            - Column of the maximum
+        Time complexity:
+            Best: O(M)
+            Worst: O(M)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        line = self.data[row]
+        column = left
+        for j in range(left + 1, right + 1):
+            if line[j] > line[column]:
+                column = j
+        return column
+
+class NumpyMatrixView(MatrixView):
+    """
+    View of a 2-D NumPy array, whose line scans run as vectorised argmax over strided views
+    """
+    def __init__(self, M, shape=None):
+        """
+        Function to initialise the view
+        Input:
+            - self: Instance of the NumpyMatrixView class
+            - M: 2-D NumPy array, or 1-D array when shape is given
+            - shape: (n, m) shape used to view a 1-D array as a row-major matrix
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(NM)
+            Aux: O(1)
+        """
+        if shape is not None:
+            M = M.reshape(shape)
+        if M.ndim != 2:
+            raise ValueError("local_maximum needs a 2-D array, or a shape for a 1-D array")
+        self.data = M
+        self.rows, self.columns = M.shape
+
+    def value(self, row, column):
+        """
+        Returns the value of a cell, as in MatrixView.value
+        """
+        return self.data[row, column]
+
+    def column_max(self, column, top, bottom):
+        """
+        Returns the row of the first maximum of a column, between two rows, using argmax over a strided view of the column
+        Time complexity:
+            Best: O(N)
+            Worst: O(N)
+        """
+        return top + int(self.data[top:bottom + 1, column].argmax())
+
+    def row_max(self, row, left, right):
+        """
+        Returns the column of the first maximum of a row, between two columns, using argmax over a view of the row
+        Time complexity:
+            Best: O(M)
+            Worst: O(M)
+        """
+        return left + int(self.data[row, left:right + 1].argmax())
+
+class BufferMatrixView(MatrixView):
+    """
+    View of an object supporting the buffer protocol, such as array.array, read through a 2-D memoryview
+    """
+    def __init__(self, view, shape=None):
+        """
+        Function to initialise the view
+        Input:
+            - self: Instance of the BufferMatrixView class
+            - view: memoryview of the buffer
+            - shape: (n, m) shape used to view a 1-D buffer as a row-major matrix
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(NM)
+            Aux: O(1)
+        """
+        if shape is not None:
+            view = view.cast("B").cast(view.format, shape)
+        if view.ndim != 2:
+            raise ValueError("local_maximum needs a 2-D buffer, or a shape for a 1-D buffer")
+        self.data = view
+        self.rows, self.columns = view.shape
+
+    def value(self, row, column):
+        """
+        Returns the value of a cell, as in MatrixView.value
+        """
+        return self.data[row, column]
+
+    def column_max(self, column, top, bottom):
+        """
+        Returns the row of the first maximum of a column, between two rows, as in MatrixView.column_max
+        """
+        data = self.data
+        row = top
+        for i in range(top + 1, bottom + 1):
+            if data[i, column] > data[row, column]:
+                row = i
+        return row
+
+    def row_max(self, row, left, right):
+        """
+        Returns the column of the first maximum of a row, between two columns, as in MatrixView.row_max
+        """
+        data = self.data
+        column = left
+        for j in range(left + 1, right + 1):
+            if data[row, j] > data[row, column]:
+                column = j
+        return column
+
+class CountingMatrixView(MatrixView):
+    """
+    View that forwards to another view and counts how many cell values the peak search inspects through it,
+    counting a cell again each time it is read
+    """
+    def __init__(self, grid):
+        """
+        Function to initialise the view
+        Input:
+            - self: Instance of the CountingMatrixView class
+            - grid: View to forward the reads to
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        self.grid = grid
+        self.rows = grid.rows
+        self.columns = grid.columns
+        self.cells = 0
+
+    def value(self, row, column):
+        """
+        Returns the value of a cell, as in MatrixView.value
+        """
+        self.cells += 1
+        return self.grid.value(row, column)
+
+    def column_max(self, column, top, bottom):
+        """
+        Returns the row of the first maximum of a column, between two rows, as in MatrixView.column_max
+        """
+        self.cells += bottom - top + 1
+        return self.grid.column_max(column, top, bottom)
+
+    def row_max(self, row, left, right):
+        """
+        Returns the column of the first maximum of a row, between two columns, as in MatrixView.row_max
+        """
+        self.cells += right - left + 1
+        return self.grid.row_max(row, left, right)
+
+class PageCountingMatrixView(CountingMatrixView):
+    """
+    Counting view of a row-major grid stored in a memory mapped file, which also records the distinct pages of the file
+    that the peak search touches, since the operating system reads a file one page at a time
+    """
+    def __init__(self, grid, offset, itemsize):
+        """
+        Function to initialise the view
+        Input:
+            - self: Instance of the PageCountingMatrixView class
+            - grid: View to forward the reads to
+            - offset: Number of bytes of the file before the first value
+            - itemsize: Number of bytes of a value
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        super().__init__(grid)
+        self.offset = offset
+        self.itemsize = itemsize
+        self.pages = set()
+
+    def touch(self, row, first, last):
+        """
+        Records the pages holding the cells of a row between two columns
+        Time complexity:
+            Best: O(1)
+            Worst: O(M * itemsize / PAGESIZE)
+        """
+        start = self.offset + (row * self.columns + first) * self.itemsize
+        end = self.offset + (row * self.columns + last + 1) * self.itemsize - 1
+        self.pages.update(range(start // mmap.PAGESIZE, end // mmap.PAGESIZE + 1))
+
+    def value(self, row, column):
+        """
+        Returns the value of a cell, as in MatrixView.value
+        """
+        self.touch(row, column, column)
+        return super().value(row, column)
+
+    def column_max(self, column, top, bottom):
+        """
+        Returns the row of the first maximum of a column, between two rows, as in MatrixView.column_max
+        Time complexity:
+            Best: O(N)
+            Worst: O(N)
+        """
+        for row in range(top, bottom + 1):
+            self.touch(row, column, column)
+        return super().column_max(column, top, bottom)
+
+    def row_max(self, row, left, right):
+        """
+        Returns the column of the first maximum of a row, between two columns, as in MatrixView.row_max
+        """
+        self.touch(row, left, right)
+        return super().row_max(row, left, right)
+
+# Shared frames of a worker process in local_maximum_batch
+batch_frames = None
+
+def local_maximum_batch(frames, shape=None, workers=1, dtype=None):
+    """
+    Function to find a local maximum in each frame of a sequence.
+    The search reads only O(N + M) cells of a frame, so copying a frame to another process costs more than searching it.
+    Worker processes are therefore only used for frames they can attach to without a copy: a shared_memory.SharedMemory
+    block or a file backed 3-D np.memmap. Even then starting the pool takes tens of milliseconds, so workers only pay off
+    for many frames that are slow to read, such as a np.memmap of a file that is not in the page cache
+    Precondition:
+        - workers is 1 unless frames is a SharedMemory block or a np.memmap
+    Input:
+        frames: Sequence of F matrices in any form accepted by local_maximum, a 3-D NumPy array of F frames,
+                a 3-D np.memmap of F frames, or a SharedMemory block holding F row-major frames back to back
+        shape: (n, m) shape used to view 1-D frames as matrices, as in local_maximum, or the (F, n, m) shape of a SharedMemory block
+        workers: Number of worker processes for a SharedMemory block or a np.memmap, None for the number of cores.
+                 With 1 worker the frames are searched in this process
+        dtype: Type of the values of a SharedMemory block, as a struct format character such as "d" or "i",
+               or any NumPy dtype when NumPy is installed
+    Return:
+        peaks: List of F indices, where peaks[i] is the [row, column] of a local maximum of frames[i], or [] if the frame is empty
+    Time complexity: 
+        Best: O(F)
+        Worst: O(F(N + M)/P)
+    Space complexity: 
+        Input: O(FNM)
+        Aux: O(F)
+    P -> Number of worker processes
+    """
+    if isinstance(frames, shared_memory.SharedMemory):
+        if shape is None or len(shape) != 3 or dtype is None:
+            raise ValueError("frames in a SharedMemory block need an (F, n, m) shape and a dtype")
+        itemsize = np.dtype(dtype).itemsize if np is not None else struct.calcsize(dtype)
+        if frames.size < shape[0] * shape[1] * shape[2] * itemsize:
+            raise ValueError(f"shared memory block {frames.name} is too small for {shape[0]} frames of {shape[1]} by {shape[2]}")
+        source = ("shared", frames.name, dtype, tuple(shape), 0)
+        data = frames.buf
+    elif np is not None and isinstance(frames, np.memmap) and isinstance(frames.base, mmap.mmap) and frames.ndim == 3:
+        # only a memmap that maps its file directly can be reopened from its filename and offset
+        source = ("file", frames.filename, frames.dtype.str, frames.shape, frames.offset)
+        data = frames
+    else:
+        if workers != 1:
+            raise ValueError("worker processes need frames in a SharedMemory block or a np.memmap, "
+                             "copying other frames to them would cost more than searching the frames")
+        return [local_maximum(frame, shape)[0] for frame in frames]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, source[3][0])
+    if workers <= 1:
+        return [frame_peak(data, source[2], source[3], i) for i in range(source[3][0])]
+    chunk_size = max(1, source[3][0] // (workers * 4))
+    with Pool(workers, initializer=frame_worker_start, initargs=(source,)) as pool:
+        return pool.map(frame_worker_peak, range(source[3][0]), chunk_size)
+
+def frame_peak(data, dtype, shape, i):
+    """
+    Function to find a local maximum of one frame of a SharedMemory block or a 3-D np.memmap
+    Input:
+        data: Buffer of the SharedMemory block, or the np.memmap
+        dtype: Type of the values
+        shape: (F, n, m) shape of the frames
+        i: Position of the frame
+    Return:
+        index: [row, column] of a local maximum of the frame, or [] if the frame is empty
+    Time complexity: 
+        Best: O(1)
+        Worst: O(N + M)
+    Space complexity: 
+        Input: O(FNM)
+        Aux: O(1)
+    """
+    _, rows, columns = shape
+    if rows == 0 or columns == 0:
+        return []
+    if np is not None:
+        frames = data if isinstance(data, np.ndarray) else np.ndarray(shape, dtype=dtype, buffer=data)
+        return peak_search(NumpyMatrixView(frames[i]))
+    size = rows * columns * struct.calcsize(dtype)
+    view = data[i * size:(i + 1) * size].cast(dtype, [rows, columns])
+    try:
+        return peak_search(BufferMatrixView(view))
+    finally:
+        # the view is released so that the block can be closed
+        view.release()
+
+def frame_worker_start(source):
+    """
+    Function run once in each worker process of local_maximum_batch to attach to the shared frames
+    Input:
+        source: ("shared", name, dtype, shape, 0) for a SharedMemory block, or ("file", filename, dtype, shape, offset) for a np.memmap
+    Return:
+        None
+    Time complexity: 
+        Best: O(1)
+        Worst: O(1)
+    Space complexity: 
+        Input: O(1)
+        Aux: O(1)
+    """
+    global batch_frames
+    kind, name, dtype, shape, offset = source
+    if kind == "file":
+        batch_frames = (None, np.memmap(name, dtype=dtype, mode="r", offset=offset, shape=shape), dtype, shape)
+    else:
+        memory = shared_memory.SharedMemory(name=name)
+        batch_frames = (memory, memory.buf, dtype, shape)
+
+def frame_worker_peak(i):
+    """
+    Function run in a worker process of local_maximum_batch to find a local maximum of one frame, as in frame_peak
+    Input:
+        i: Position of the frame
+    Return:
+        index: [row, column] of a local maximum of the frame, or [] if the frame is empty
+    """
+    _, data, dtype, shape = batch_frames
+    return frame_peak(data, dtype, shape, i)
+
+def local_maximum_file(path, dtype, shape, offset=0):
+    """
+    Function to find index of local maximum of a grid stored in a raw row-major binary file, reading only the cells the search needs
     Precondition:
-        - Matrix has equal number of rows and columns
+        - The file holds at least offset + n * m * itemsize bytes
+        - Values are in native byte order when NumPy is not installed
     Postcondition:
-        - Any one local maximum of the matrix is returned
+        - The file is not loaded into memory, it is memory mapped and only the scanned rows and columns are read
     Input:
-        M: n-by-n grid of distinct integers (i.e., an n-by-n matrix)
-        rows: Number of rows in matrix
-        columns: Number of columns in matrix
-        middle: Middle column of matrix
+        path: Path of the binary file
+        dtype: Type of the values, as a struct format character such as "d" or "i", or any NumPy dtype when NumPy is installed
+        shape: (n, m) shape of the grid
+        offset: Number of bytes before the first value
     Return: 
-        Value of local maximum
+        index: index of the local maximum, as returned by local_maximum
+        bytes_read: Number of bytes in the distinct pages of the file touched by the search, which is what the operating system
+                    has to read from disk, ignoring read ahead. A column scan touches one page per row
     Time complexity: 
-        Best: O(N)
-        Worst: O(N)
+        Best: O(1)
+        Worst: O(N + M)
     Space complexity: 
-        Input: O(N^2)
-        Aux: O(N/2)
-    """
-    max = 0
-    # Finding maximum value in the middle column
-    max, maximum_index = findMax(M, rows, middle, max)
-    if middle in [0, columns - 1]:
-        return max
-
-    # Checking If the element in the middle column is a local maximum
-    if (max >= M[maximum_index][middle - 1] and
-        max >= M[maximum_index][middle + 1]):
-        return max
-
-    # Checking if the maximum is lesser than elements on its left
-    if (max < M[maximum_index][middle - 1]):
-        return local_max_recursion(M, rows, columns, middle - ceil(middle / 2.0))
-
-    if(columns > middle+ceil(middle/2.0)):    
-        return local_max_recursion(M, rows, columns,middle + ceil(middle / 2.0))
+        Input: O(1)
+        Aux: O(1)
+    """
+    rows, columns = shape
+    if np is not None:
+        itemsize = np.dtype(dtype).itemsize
     else:
-        return local_max_recursion(M,rows,columns, middle + 1)
- 
-def index_2d(M,value):
+        itemsize = struct.calcsize(dtype)
+    size = rows * columns * itemsize
+    if os.path.getsize(path) < offset + size:
+        raise ValueError(f"{path} is too small for a {rows} by {columns} grid")
+    if rows == 0 or columns == 0:
+        return [[]], 0
+
+    if np is not None:
+        grid = PageCountingMatrixView(NumpyMatrixView(np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows, columns))),
+                                      offset, itemsize)
+        index = peak_search(grid)
+        return [index], len(grid.pages) * mmap.PAGESIZE
+
+    with open(path, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        view = memoryview(data)[offset:offset + size].cast(dtype, [rows, columns])
+        grid = PageCountingMatrixView(BufferMatrixView(view), offset, itemsize)
+        index = peak_search(grid)
+        bytes_read = len(grid.pages) * mmap.PAGESIZE
+        # every view of the map has to be released before it can be closed
+        del grid
+        view.release()
+    finally:
+        data.close()
+    return [index], bytes_read
+
+def local_maxima(M, threshold=None, shape=None):
     """
-    Function to find index of an element in a matrix
+    Function to find the index of every strict local maximum of a grid in one pass, comparing each cell with its neighbours
     Postcondition:
-        - Index of the value is returned
+        - Every returned index holds a value greater than all of its neighbours, and greater than threshold if one is given
     Input:
-        M: n-by-n grid of distinct integers (i.e., an n-by-n matrix)
-        rows: Number of rows in matrix
-        columns: Number of columns in matrix
-        value: Value to be searched for in matrix
+        M: n-by-m grid of numbers, in any form accepted by local_maximum
+        threshold: Only local maxima with a value greater than threshold are returned
+        shape: (n, m) shape used to view a 1-D buffer such as array.array as a row-major matrix
     Return: 
-        index: index of the local maximum
+        peaks: List of the [row, column] of each strict local maximum, in row-major order
+    Time complexity: 
+        Best: O(NM)
+        Worst: O(NM)
+    Space complexity: 
+        Input: O(NM)
+        Aux: O(NM)
+    """
+    if np is not None:
+        grid = np.asarray(M)
+        if shape is not None:
+            grid = grid.reshape(shape)
+        if grid.size == 0:
+            return []
+        # a cell is kept while it is greater than the neighbour on each side, cells on the border have no neighbour there
+        mask = np.ones(grid.shape, dtype=bool)
+        mask[1:, :] &= grid[1:, :] > grid[:-1, :]
+        mask[:-1, :] &= grid[:-1, :] > grid[1:, :]
+        mask[:, 1:] &= grid[:, 1:] > grid[:, :-1]
+        mask[:, :-1] &= grid[:, :-1] > grid[:, 1:]
+        if threshold is not None:
+            mask &= grid > threshold
+        return np.argwhere(mask).tolist()
+
+    grid = as_matrix_view(M, shape)
+    value = grid.value
+    peaks = []
+    for i in range(grid.rows):
+        for j in range(grid.columns):
+            current = value(i, j)
+            if threshold is not None and not current > threshold:
+                continue
+            if (i > 0 and not current > value(i - 1, j) or
+                    i < grid.rows - 1 and not current > value(i + 1, j) or
+                    j > 0 and not current > value(i, j - 1) or
+                    j < grid.columns - 1 and not current > value(i, j + 1)):
+                continue
+            peaks.append([i, j])
+    return peaks
+
+def top_k_peaks(M, k, threshold=None, shape=None):
+    """
+    Function to find the k strongest strict local maxima of a grid, keeping only k candidates in a heap
+    Input:
+        M: n-by-m grid of numbers, in any form accepted by local_maximum
+        k: Number of local maxima to return
+        threshold: Only local maxima with a value greater than threshold are considered
+        shape: (n, m) shape used to view a 1-D buffer such as array.array as a row-major matrix
+    Return: 
+        peaks: List of the [row, column] of at most k strict local maxima, from the greatest value to the smallest.
+               Equal values are ordered in row-major order
+    Time complexity: 
+        Best: O(NM)
+        Worst: O(NM + PlogK)
+    Space complexity: 
+        Input: O(NM)
+        Aux: O(P + K)
+    P -> Number of strict local maxima
+    """
+    if k <= 0:
+        return []
+    grid = as_matrix_view(M, shape)
+    # the heap holds the k strongest peaks seen so far, with the weakest at the top, so each new peak only has to beat it
+    heap = []
+    order = 0
+    for row, column in local_maxima(M, threshold, shape):
+        item = (grid.value(row, column), -order, row, column)
+        order = order + 1
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+    heap.sort(reverse=True)
+    return [[row, column] for _, _, row, column in heap]
+
+class PeakTracker:
+    """
+    Tracker that follows a local maximum across a stream of slowly changing frames, starting each search from the previous peak
+    """
+    def __init__(self, max_steps=None):
+        """
+        Function to initialise a tracker with no previous frame
+        Input:
+            - self: Instance of the PeakTracker class
+            - max_steps: Number of hill climbing steps allowed per frame before falling back to peak_search,
+              defaults to half the number of rows and columns of the frame
+        Returns:
+            - None
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        self.max_steps = max_steps
+        self.peak = None
+        self.frames = 0
+        self.cells = 0
+        self.fallbacks = 0
+
+    def update(self, M, shape=None):
+        """
+        Function to find a local maximum of the next frame
+        Postcondition:
+            - No neighbour of the returned index holds a greater value
+        Input:
+            - self: Instance of the PeakTracker class
+            - M: n-by-m grid of numbers, in any form accepted by local_maximum
+            - shape: (n, m) shape used to view a 1-D buffer such as array.array as a row-major matrix
+        Returns:
+            - index: [row, column] of a local maximum of the frame, or [] if the frame is empty
+        Time complexity:
+            Best: O(1)
+            Worst: O(N + M)
+        Space complexity:
+            Input: O(NM)
+            Aux: O(1)
+        """
+        grid = CountingMatrixView(as_matrix_view(M, shape))
+        self.frames += 1
+        if grid.rows == 0 or grid.columns == 0:
+            self.peak = None
+            return []
+
+        index = None
+        if self.peak is not None and self.peak[0] < grid.rows and self.peak[1] < grid.columns:
+            index = self.climb(grid)
+        if index is None:
+            # the peak moved too far from the previous one, so the frame is searched from scratch
+            self.fallbacks += 1
+            index = peak_search(grid)
+        self.cells += grid.cells
+        self.peak = index
+        return index
+
+    def climb(self, grid):
+        """
+        Function to walk from the previous peak to a greater neighbour until none is left
+        Input:
+            - self: Instance of the PeakTracker class
+            - grid: CountingMatrixView of the frame
+        Returns:
+            - index: [row, column] of a local maximum, or None if it was not reached within the allowed number of steps
+        Time complexity:
+            Best: O(1)
+            Worst: O(S)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        S -> Allowed number of steps
+        """
+        value = grid.value
+        steps = self.max_steps
+        if steps is None:
+            steps = (grid.rows + grid.columns) // 2
+        row, column = self.peak
+        current = value(row, column)
+        for _ in range(steps + 1):
+            next_row, next_column, best = row, column, current
+            for i, j in ((row - 1, column), (row + 1, column), (row, column - 1), (row, column + 1)):
+                if 0 <= i < grid.rows and 0 <= j < grid.columns:
+                    neighbour = value(i, j)
+                    if neighbour > best:
+                        next_row, next_column, best = i, j, neighbour
+            if (next_row, next_column) == (row, column):
+                return [row, column]
+            row, column, current = next_row, next_column, best
+        return None
+
+    def average_cells(self):
+        """
+        Returns the average number of cells read per frame
+        Input:
+            - self: Instance of the PeakTracker class
+        Returns:
+            - Average number of cells read per frame, or 0 if no frame was given
+        Time complexity:
+            Best: O(1)
+            Worst: O(1)
+        Space complexity:
+            Input: O(1)
+            Aux: O(1)
+        """
+        return self.cells / self.frames if self.frames else 0
+
+def peak_search(grid):
+    """
+    Function to find the index of a local maximum by halving a window of the matrix, splitting it by a column and by a row in turn
+    Precondition:
+        - The matrix has at least one row and one column
+    Postcondition:
+        - No neighbour of the returned index holds a greater value
+    Input:
+        grid: MatrixView of an n-by-m grid of integers
+    Return: 
+        index: [row, column] of a local maximum
     Time complexity: 
         Best: O(N)
-        Worst: O(N)
+        Worst: O(N + M)
     Space complexity: 
-        Input: O(N^2)
-        Aux: O(N)
+        Input: O(NM)
+        Aux: O(1)
     """
-    for i, j in enumerate(M):
-        if value in j:
-            return [i, j.index(value)]
+    value = grid.value
+    top, bottom, left, right = 0, grid.rows - 1, 0, grid.columns - 1
+    # largest cell seen next to a dividing line so far, the search always continues in the half that holds it
+    best_row = best_column = None
+    split_column = True
+    while True:
+        # finding the maximum on the dividing line of the window
+        if split_column:
+            middle = (left + right) // 2
+            row, column = grid.column_max(middle, top, bottom), middle
+        else:
+            middle = (top + bottom) // 2
+            row, column = middle, grid.row_max(middle, left, right)
+
+        # finding its greatest neighbour inside the window
+        next_row, next_column = row, column
+        for i, j in ((row - 1, column), (row + 1, column), (row, column - 1), (row, column + 1)):
+            if top <= i <= bottom and left <= j <= right and value(i, j) > value(next_row, next_column):
+                next_row, next_column = i, j
+        if best_row is None or value(next_row, next_column) > value(best_row, best_column):
+            best_row, best_column = next_row, next_column
+
+        # a line maximum with no greater neighbour, that is at least the best seen, is also a local maximum of the whole matrix
+        if (next_row, next_column) == (row, column) and value(row, column) >= value(best_row, best_column):
+            return [row, column]
+
+        if split_column:
+            if best_column < middle:
+                right = middle - 1
+            else:
+                left = middle + 1
+        else:
+            if best_row < middle:
+                bottom = middle - 1
+            else:
+                top = middle + 1
+        split_column = not split_column
 
 if __name__ == "__main__":
     wordlist = ["limes", "spare", "store", "loser", "aster", "pares","taser", "pears", "stare", "spear", "parse", "reaps", "rates","tears", "losts"]
@@ -321,6 +2063,10 @@ if __name__ == "__main__":
     word = "catrse"
     marker = [1,1,0,0,0,0]
     trainer(wordlist, word, marker)
+
+    # The same query answered from a prebuilt index, which can be reused for further guesses
+    index = WordIndex(["costar", "carets", "recast", "traces", "reacts", "caster","caters", "crates", "actors", "castor"])
+    index.trainer(word, marker)
      
     # M1_Actual_Value = [[]]
     M1 = [[]]
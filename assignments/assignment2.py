@@ -1,27 +1,56 @@
-def ideal_place(relevant):
+import heapq
+import os
+import random
+from array import array
+from collections import deque
+from functools import partial
+from math import ceil
+from multiprocessing import Pool
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Number of random pivots that may leave more than 3/4 of the range before introselect switches to median of medians
+BAD_PIVOT_LIMIT = 3
+
+def ideal_place(relevant, buffer=None):
     """
     Returns a location that is the minimum amount of combined distance to any relevant point.
+    The Manhattan distance splits by axis, so the location is the median of the relevant points on every axis,
+    for points of any number of dimensions d.
     Input:
-        - relevant: The location that we want the minimum distance to
+        - relevant: The location that we want the minimum distance to, as a list of points or an (N, d) NumPy array.
+                    With a NumPy array the medians of all axes are selected at once by numpy.partition
+        - buffer: Optional preallocated mutable sequence of at least N items, such as a list, array('d') or NumPy array,
+                  used as scratch space for the median selection of each axis
     Returns:
         - Single location, that has a minimum combined distance from any relevant point.
     Time Complexity:
         Best: O(1)
-        Worst: O(N)
+        Worst: O(Nd)
     Space Complexity:
         Best: O(1)
-        Worst: O(N)
+        Worst: O(Nd)
     N -> number of relevant points
+    d -> number of axes of each point
     """
-    desired_place = [find_median(relevant, 0),find_median(relevant, 1)]
+    if np is not None and isinstance(relevant, np.ndarray):
+        median_index = len(relevant)//2
+        return np.partition(relevant, median_index, axis=0)[median_index].tolist()
+
+    if buffer is None:
+        buffer = [0] * len(relevant)
+    desired_place = [find_median(relevant, axis, buffer) for axis in range(len(relevant[0]))]
     return desired_place
 
-def find_median(relevant, index):
+def find_median(relevant, index, buffer=None):
     """
     Function to return the median value out of the relevant points, on a particular axis
     Input:
         - relevant: Locations on our grid that we want the minimum distance to
         - index: The index of the axis in the relevant points that we want to find
+        - buffer: Optional preallocated mutable sequence of at least N items, which is overwritten with the values on the axis
     Returns:
         - Median value from a particular index
     Time Complexity:
@@ -34,143 +63,129 @@ def find_median(relevant, index):
     """
     length_of_arry = len(relevant)
     median_index = length_of_arry//2
-    arry_on_axis = [relevant[i][index] for i in range(length_of_arry)]
+    if buffer is None:
+        buffer = [0] * length_of_arry
+    for i in range(length_of_arry):
+        buffer[i] = relevant[i][index]
 
-    desired_value = quick_select(arry_on_axis, 0, length_of_arry-1, median_index)
+    desired_value = introselect(buffer, median_index, 0, length_of_arry-1)
     return desired_value
 
-def quick_select(array, low, high, k):
+def introselect(array, k, low=0, high=None):
     """
-    Implementation of quick sort algorithm to select the kth element from a list using partitioning
+    Iterative selection of the kth smallest element, which partitions the array in place around random pivots
+    and switches to median of medians pivots once too many random pivots were bad
     Parameters:
-        - array: Array of integers that we want to perform the quick select on
-        - low: Lower bound index for the integer that we want to search for
-        - high: Higher bound index for the integer that we want to search for
-        - k: Index of the element we want to find
-    Returns:
-        - The kth element, from an array
-    Time Complexity:
-        Best: O(1)
-        Worst: O(N)
-    Space Complexity:
-        Best: O(1)
-        Worst: O(logN)
-    N -> number of items in the array
-    """
-    if len(array)== 1:
-        return array[k]
-    pivot = median_of_medians(array)
-    mid = partition(array, low, high, pivot)
-    if k > mid:
-        return quick_select(array, mid+1, high, k)
-    elif mid > k:
-        return quick_select(array, low, mid-1, k)
-    else:
-        return array[k]
-
-def median_of_medians(array):
-    """
-    Median selection algorithm used to find a good pivot
-    Input:
-        - array: Array of integers we want to find the approximate median for
+        - array: Mutable sequence of numbers, such as a list, array('d') or NumPy array. It is reordered in place
+        - k: Index of the element we want to find, with low <= k <= high
+        - low: Lower bound index of the range to select from
+        - high: Higher bound index of the range to select from, defaults to the last index
     Returns:
-        - A median value that can be used as apivot
+        - The kth element, as it would be in array[low:high+1] after sorting
     Time Complexity:
-        Best: O(1)
+        Best: O(N)
         Worst: O(N)
     Space Complexity:
         Best: O(1)
         Worst: O(logN)
-    N -> number of items in the array
-    """
-    n = len(array)
-    if n <= 5:
-        return insertion_sort(array)
-    medians = [insertion_sort(array[5*i:5*i+5]) for i in range(n//5)]
-    return quick_select(medians, 0, len(medians), len(medians)//2)    
-
-def insertion_sort(array):
-    """
-    Sorting algorithm that places the input element at its suitable place in each pass
-    Input:
-        - array: The list that needs to be sorted
-    Returns:
-        - The median in the sorted list
-    Time Complexity:
-        Best: O(N)
-        Worst: O(N^2)
-    Space Complexity:
-        Best: O(1)
-        Worst: O(1)
-    N -> number of items in the array
+    N -> number of items in the range
     """
-    arry_length = len(array)
-    for i in range (1, arry_length):
-        pointer = array[i]
-        j = i-1
-        while j >= 0 and pointer < array[j]:
-            array[j + 1] = array[j]
-            j -= 1
-        array[j + 1] = pointer
-    return array[arry_length//2]
+    if high is None:
+        high = len(array) - 1
+    bad_pivots = 0
+    while low < high:
+        size = high - low + 1
+        if bad_pivots < BAD_PIVOT_LIMIT:
+            pivot = array[random.randint(low, high)]
+        else:
+            pivot = median_of_medians_in_place(array, low, high)
+        lower, upper = three_way_partition(array, low, high, pivot)
+        if k < lower:
+            high = lower - 1
+        elif k > upper:
+            low = upper + 1
+        else:
+            return array[k]
+        if high - low + 1 > 3 * size // 4:
+            bad_pivots += 1
+    return array[k]
 
-def partition(array, low, high, pivot):
+def three_way_partition(array, low, high, pivot):
     """
-    Splits up the algorithm, and partitions them into two sides, based on a pivot.
+    Partitions a range of the array in place into the items smaller than, equal to and greater than a pivot
     Parameters:
         - array: The list that needs to be partitioned
         - low: The lower bound index for what we want to partition
         - high: The higher bound index for what we want to partition
-        - pivot:The item we want to partition the list around.
+        - pivot: The value we want to partition the range around
     Returns:
-        - The mid point in the array after partitioning has been done
+        - lower, upper: The items equal to the pivot are array[lower:upper+1], smaller items are before them and greater items after them
     Time Complexity:
-        Best: O(1)
+        Best: O(N)
         Worst: O(N)
     Space Complexity:
         Best: O(1)
         Worst: O(1)
-    N -> number of items in the array
-    """
-    for i in range(low, high):
-        if array[i] == pivot:
-            swap(array, high, i)
-            break
- 
-    v = array[high]
+    N -> number of items in the range
+    """
+    lower = low
     i = low
-    for j in range(low, high):
-        if (array[j] <= v):
-            swap(array, i, j)
+    upper = high
+    while i <= upper:
+        if array[i] < pivot:
+            array[lower], array[i] = array[i], array[lower]
+            lower += 1
+            i += 1
+        elif array[i] > pivot:
+            array[upper], array[i] = array[i], array[upper]
+            upper -= 1
+        else:
             i += 1
-    swap(array, i, high)
-    return i
+    return lower, upper
 
-def swap(array, i, j):
+def median_of_medians_in_place(array, low, high):
     """
-    Function to swap two elements in an array
-    Input:
-        - array: The array in whose elements need to be swapped
-        - i: Index of the first item to be swapped
-        - j: Index of the second item we want swapped
+    Median of medians pivot selection that sorts each group of 5 in place and gathers the group medians at the start of the range,
+    without slicing the array or building a list of medians
+    Parameters:
+        - array: Mutable sequence of numbers, reordered in place
+        - low: Lower bound index of the range
+        - high: Higher bound index of the range
     Returns:
-        - Nothing
+        - A value of the range that has at least 3/10 of the range on each side, to be used as a pivot
     Time Complexity:
-        Best: O(1)
-        Worst: O(1)
+        Best: O(N)
+        Worst: O(N)
     Space Complexity:
         Best: O(1)
-        Worst: O(1)
+        Worst: O(logN)
+    N -> number of items in the range
     """
-    array[i],array[j] = array[j],array[i]
+    groups = 0
+    for start in range(low, high + 1, 5):
+        end = min(start + 4, high)
+        # insertion sort of the group
+        for i in range(start + 1, end + 1):
+            pointer = array[i]
+            j = i - 1
+            while j >= start and pointer < array[j]:
+                array[j + 1] = array[j]
+                j -= 1
+            array[j + 1] = pointer
+        median = start + (end - start) // 2
+        array[low + groups], array[median] = array[median], array[low + groups]
+        groups += 1
+    return introselect(array, low + groups // 2, low, low + groups - 1)
 
-class MinHeap():    #MinHeap class needed for question2
-    def __init__(self, max_size: int) -> None:
+class MedianTracker:
+    """
+    Online median of a multiset of numbers, kept in two heaps with lazy deletion
+    """
+    def __init__(self):
         """
-        Method to initialise the heap
+        Method to initialise an empty tracker
         Input:
-            - self: Instance of the MinHeap class
-            - max_size: maximum size of heap
+            - self: Instance of the MedianTracker class
         Returns:
             - None
         Time complexity: 
@@ -180,16 +195,22 @@ class MinHeap():    #MinHeap class needed for question2
             Input: O(1)
             Aux: O(1)
         """
-        self.length = 0
-        self.the_array = [0]*(max_size+1)
+        # low is a max heap of the n//2 smallest values, stored negated, and high is a min heap of the others,
+        # so that the top of high is the value at index n//2 in sorted order, as selected by find_median
+        self.low = []
+        self.high = []
+        self.low_size = 0
+        self.high_size = 0
+        # values removed but still stored in a heap, with how many copies of each are waiting to be discarded
+        self.delayed = {}
 
     def __len__(self) -> int:
         """
-        Returns the number of elements in the heap
+        Returns the number of values in the tracker
         Input:
-            - self: Instance of the MinHeap class
+            - self: Instance of the MedianTracker class
         Returns:
-            - Number of elements in the heap 
+            - Number of values
         Time complexity: 
             Best: O(1)
             Worst: O(1)
@@ -197,315 +218,1782 @@ class MinHeap():    #MinHeap class needed for question2
             Input: O(1)
             Aux: O(1)
         """
-        return self.length
+        return self.low_size + self.high_size
 
-    def is_full(self) -> bool:
+    def add(self, value) -> None:
         """
-        Checks if the heap is full
+        Adds a value to the tracker
         Input:
-            - self: Instance of the MinHeap class
+            - self: Instance of the MedianTracker class
+            - value: Number to add
         Returns:
-            - True if the heap is full, else false
+            - None
         Time complexity: 
-            Best: O(1)
-            Worst: O(1)
+            Best: O(logN)
+            Worst: O(logN) amortised
         Space complexity: 
             Input: O(1)
             Aux: O(1)
         """
-        return self.length + 1 == len(self.the_array)
+        if self.low_size and value <= -self.low[0]:
+            heapq.heappush(self.low, -value)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, value)
+            self.high_size += 1
+        self.rebalance()
 
-    def rise(self, k: int) -> None:
+    def remove(self, value) -> None:
         """
-        Rise element at index k to its correct position
+        Removes one copy of a value from the tracker, it is only discarded from its heap once it reaches the top
         :precondition: 
-            - 1 <= k <= self.length
+            - value was added to the tracker and not removed since
         Input:
-            - self: Instance of the MinHeap class
-            - k: index of element
+            - self: Instance of the MedianTracker class
+            - value: Number to remove
         Returns:
             - None
         Time complexity: 
             Best: O(1)
-            Worst: O(1)
+            Worst: O(logN) amortised
         Space complexity: 
             Input: O(1)
             Aux: O(1)
         """
-        item = self.the_array[k]
-        while k > 1 and item[1] < self.the_array[k // 2][1]:
-            self.the_array[k] = self.the_array[k // 2]
-            k //= 2
-        self.the_array[k] = item
+        self.delayed[value] = self.delayed.get(value, 0) + 1
+        if self.low_size and value <= -self.low[0]:
+            self.low_size -= 1
+            if value == -self.low[0]:
+                self.prune(self.low, -1)
+        else:
+            self.high_size -= 1
+            if value == self.high[0]:
+                self.prune(self.high, 1)
+        self.rebalance()
 
-    def add(self, element) -> bool:
+    def prune(self, heap, sign) -> None:
         """
-        Swaps elements while risingInput:
+        Discards removed values from the top of a heap
         Input:
-            - self: Instance of the MinHeap class
-            - element: element to be swapped
+            - self: Instance of the MedianTracker class
+            - heap: self.low or self.high
+            - sign: -1 for self.low, whose values are negated, 1 for self.high
         Returns:
             - None
         Time complexity: 
             Best: O(1)
-            Worst: O(N)
+            Worst: O(KlogN)
         Space complexity: 
             Input: O(1)
             Aux: O(1)
+        K -> number of values discarded
         """
-        if self.is_full():
-            raise IndexError
-
-        self.length += 1
-        self.the_array[self.length] = element
-        self.rise(self.length)
+        while heap and self.delayed.get(sign * heap[0], 0):
+            value = sign * heapq.heappop(heap)
+            self.delayed[value] -= 1
+            if self.delayed[value] == 0:
+                del self.delayed[value]
 
-    def smallest_child(self, k: int) -> int:
+    def rebalance(self) -> None:
         """
-        Returns the index of k's child with greatest value.
-        :precondition: 
-            - 1 <= k <= self.length // 2
+        Moves values between the heaps until low holds exactly the n//2 smallest values, and discards removed values from both tops
         Input:
-            - self: Instance of the MinHeap class
-            - k: Index
+            - self: Instance of the MedianTracker class
         Returns:
-            - Index of K's child with greatest value
+            - None
         Time complexity: 
             Best: O(1)
-            Worst: O(N)
+            Worst: O(logN) amortised
         Space complexity: 
             Input: O(1)
             Aux: O(1)
         """
-        if 2 * k == self.length or \
-                self.the_array[2 * k][1] < self.the_array[2 * k + 1][1]:
-            return 2 * k
-        else:
-            return 2 * k + 1
+        target = (self.low_size + self.high_size) // 2
+        while self.low_size > target:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self.prune(self.low, -1)
+        while self.low_size < target:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.low_size += 1
+            self.high_size -= 1
+            self.prune(self.high, 1)
+        self.prune(self.low, -1)
+        self.prune(self.high, 1)
+        # removed values buried below the tops are only discarded by rebuilding the heaps, once they outnumber the live values
+        if len(self.low) + len(self.high) > 2 * (self.low_size + self.high_size) + 16:
+            self.compact()
 
-    def sink(self, k: int) -> None:
-        """ 
-        Make the element at index k sink to the correct position.
-        :precondition: 
-            - 1 <= k <= self.length // 2
+    def compact(self) -> None:
+        """
+        Rebuilds both heaps from the values that were not removed
         Input:
-            - self: Instance of the MinHeap class
-            - k: index
+            - self: Instance of the MedianTracker class
         Returns:
-            - Index of k's child with greatest value
+            - None
         Time complexity: 
-            Best: O(logN)
-            Worst: O(logN)
+            Best: O(NlogN)
+            Worst: O(NlogN)
         Space complexity: 
             Input: O(1)
-            Aux: O(1)
+            Aux: O(N)
         """
-        item = self.the_array[k]
-
-        while 2 * k <= self.length:
-            min_child = self.smallest_child(k)
-            if self.the_array[min_child][1] >= item[1]:
-                break
-            self.the_array[k] = self.the_array[min_child]
-            k = min_child
+        values = [-item for item in self.low] + self.high
+        values.sort()
+        kept = []
+        for value in values:
+            if self.delayed.get(value, 0):
+                self.delayed[value] -= 1
+            else:
+                kept.append(value)
+        self.delayed = {}
+        # a sorted list is already a min heap, and the negated prefix only needs heapify
+        self.low = [-value for value in kept[:len(kept) // 2]]
+        heapq.heapify(self.low)
+        self.high = kept[len(kept) // 2:]
 
-        self.the_array[k] = item
-        
-    def get_min(self):
-        """ 
-        Removes the minimum element from the heap and returns its value 
+    def median(self):
+        """
+        Returns the median, the value at index n//2 in sorted order
         Input:
-            - self: Instance of the MinHeap class
+            - self: Instance of the MedianTracker class
         Returns:
-            - minimum_value: minimum value in the heap 
+            - Median of the values
         Time complexity: 
-            Best: O(N)
-            Worst: O(N)
+            Best: O(1)
+            Worst: O(1)
         Space complexity: 
             Input: O(1)
             Aux: O(1)
         """
-        if self.length == 0:
+        if self.high_size == 0:
             raise IndexError
+        return self.high[0]
 
-        min_elt = self.the_array[1]
-        self.length -= 1
-        if self.length > 0:
-            self.the_array[1] = self.the_array[self.length+1]
-            self.sink(1)
-        return min_elt
-    
-
-    def update(self,v):
+class MeetingPointTracker:
+    """
+    Online version of ideal_place, which keeps the median of every axis as relevant points are added and removed
+    """
+    def __init__(self, dimensions=2):
         """
-        Updates new distance to a pre-existing vertex
+        Method to initialise a tracker with no relevant points
         Input:
-            - self: Instance of the MinHeap class
-            - v: vertex whose distance needs to be updated
+            - self: Instance of the MeetingPointTracker class
+            - dimensions: Number of axes d of each point
         Returns:
             - None
         Time complexity: 
-            Best: O(N)
-            Worst: O(N)
+            Best: O(d)
+            Worst: O(d)
         Space complexity: 
             Input: O(1)
-            Aux: O(N)
+            Aux: O(d)
         """
-        start = self.the_array[1]
-        iter = 1
-        while iter < self.length:
-            if start[0] == v[0]:
-                start = v
-            elif v[0] > start[0]:
-                iter = (iter*2)+1
-            else:
-                iter *= 2
-    
-    def get_distance(self,v):
+        self.axes = [MedianTracker() for _ in range(dimensions)]
+
+    def __len__(self) -> int:
         """
-        Returns the distance of a particular vertex
+        Returns the number of relevant points
         Input:
-            - self: Instance of the MinHeap class
-            - v: vertex whose distance needs to be updated
+            - self: Instance of the MeetingPointTracker class
         Returns:
-            - distance of vertex
+            - Number of relevant points
         Time complexity: 
-            Best: O(N)
-            Worst: O(N)
+            Best: O(1)
+            Worst: O(1)
         Space complexity: 
             Input: O(1)
-            Aux: O(N)
+            Aux: O(1)
         """
-        start = self.the_array[1]
-        iter = 1
-        for i in range(1,self.length):
-            if self.the_array[i][0] == v:
-                return self.the_array[i][1]
+        return len(self.axes[0])
 
-class Node: # Node class needed for question 2
-    """
-    Implementation of a generic node class
-    """
-    def __init__(self,value):
+    def add(self, point) -> None:
         """
-        Function to initialise the node object
+        Adds a relevant point
         Input:
-            - self: Instance of the Node class
+            - self: Instance of the MeetingPointTracker class
+            - point: Sequence of d coordinates
         Returns:
             - None
         Time complexity: 
-            Best: O(1)
-            Worst: O(1)
+            Best: O(dlogN)
+            Worst: O(dlogN) amortised
         Space complexity: 
-            Input: O(1)
-            Aux: O(1)
+            Input: O(d)
+            Aux: O(d)
         """
-        self.vertex = value
-        self.edges = []
-        self.visited = False
-        self.discovered = False
-    
-    def printEdges(self):
+        for axis in range(len(self.axes)):
+            self.axes[axis].add(point[axis])
+
+    def remove(self, point) -> None:
         """
-        Function to print each edge along with its weight
+        Removes a relevant point that was added before
         Input:
-            - self: Instance of the Node class
+            - self: Instance of the MeetingPointTracker class
+            - point: Sequence of d coordinates
         Returns:
             - None
         Time complexity: 
-            Best: O(E)
-            Worst: O(E)
-        E -> Number of edges
+            Best: O(d)
+            Worst: O(dlogN) amortised
+        Space complexity: 
+            Input: O(d)
+            Aux: O(d)
+        """
+        for axis in range(len(self.axes)):
+            self.axes[axis].remove(point[axis])
+
+    def ideal_place(self):
+        """
+        Returns the same location as ideal_place for the current relevant points
+        Input:
+            - self: Instance of the MeetingPointTracker class
+        Returns:
+            - Single location, that has a minimum combined distance from any relevant point.
+        Time complexity: 
+            Best: O(d)
+            Worst: O(d)
         Space complexity: 
             Input: O(1)
-            Aux: O(E)
+            Aux: O(d)
         """
-        for i in self.edges:
-            print(f"Edge to {str(i.v)} with a weight of {str(i.w)}")
-            
-class Edge: # Edge class needed for question 2
+        return [tracker.median() for tracker in self.axes]
+
+class SlidingMeetingPoint:
     """
-    Class for edge data
+    Meeting point of only the last W relevant points that were added. Points leave in the order they were added,
+    so it keeps a MeetingPointTracker of the window rather than being one, and has no remove
     """
-    def __init__(self,u,v,w):
+    def __init__(self, window, dimensions=2):
         """
-        Function to initialise the edge object
+        Method to initialise a tracker with no relevant points
+        Input:
+            - self: Instance of the SlidingMeetingPoint class
+            - window: Number of most recent points W that are kept
+            - dimensions: Number of axes d of each point
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(d)
+            Worst: O(d)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(d)
         """
-        self.u = u
-        self.v = v
-        self.w = w
+        self.tracker = MeetingPointTracker(dimensions)
+        self.window = window
+        self.points = deque()
 
-class RoadGraph:
-    def __init__(self,roads):
+    def __len__(self) -> int:
         """
-        Function to initialise the RoadGraph object
+        Returns the number of relevant points in the window
         Input:
-            - self: Instance of the Node class
-            - roads: A list of roads roads represted as a list of tuples (u, v, w), u is the starting location ID for a road, 
-              v is the ending location ID for a road, w is the distance along that road,
+            - self: Instance of the SlidingMeetingPoint class
         Returns:
-            - None
+            - Number of relevant points in the window
         Time complexity: 
             Best: O(1)
-            Worst: O(N)
+            Worst: O(1)
         Space complexity: 
             Input: O(1)
-            Aux: O(N)
+            Aux: O(1)
         """
-        max_vertex= roads[0][0]
-        for i in range(len(roads)):
-            if roads[i][0] > max_vertex:
-                max_vertex = roads[i][0]
-        self.V = max_vertex
-        self.graph = [None] * (self.V+1)
-        self.edges = [[-1 for _ in range(max_vertex)] for _ in range(max_vertex)]
-        self.visited = []
-        print(self.graph)
-        self.createGraph(roads)
+        return len(self.points)
 
-    def createGraph(self,roads):
+    def add(self, point) -> None:
         """
-        Function to create graph using the starting location, ending location and distance givwn in the roads list
+        Adds a relevant point, removing the oldest one once there are more than W
         Input:
-            - self: Instance of the Node class
-            - roads: A list of roads roads represted as a list of tuples (u, v, w), u is the starting location ID for a road, 
-              v is the ending location ID for a road, w is the distance along that road,
+            - self: Instance of the SlidingMeetingPoint class
+            - point: Sequence of d coordinates
         Returns:
             - None
         Time complexity: 
-            Best: O(1)
-            Worst: O(V*N)
-        N -> Length of roads list
+            Best: O(dlogW)
+            Worst: O(dlogW) amortised
         Space complexity: 
-            Input: O(1)
-            Aux: O(E)
+            Input: O(d)
+            Aux: O(d)
         """
-        for j in range(self.V+1):
-            self.graph[j] = (Node(j))
-        print(self.graph)
-        for k in roads:
-            self.graph[k[0]].edges.append(Edge(k[0],k[1],k[2]))
+        self.tracker.add(point)
+        self.points.append(point)
+        if len(self.points) > self.window:
+            self.tracker.remove(self.points.popleft())
 
-    def printGraph(self):
+    def ideal_place(self):
+        """
+        Returns the same location as ideal_place for the points in the window, as in MeetingPointTracker.ideal_place
+        """
+        return self.tracker.ideal_place()
+
+class QuantileSketch:
+    """
+    KLL quantile sketch: a mergeable summary of a stream of numbers in bounded memory, that answers quantiles with a rank error of about 2/k
+    """
+    def __init__(self, k=200):
         """
-        Function to print each vertex in the graph
+        Method to initialise an empty sketch
         Input:
-            - self: Instance of the Node class
+            - self: Instance of the QuantileSketch class
+            - k: Capacity of the top compactor, a larger k gives a smaller error and a larger sketch
         Returns:
             - None
         Time complexity: 
-            Best: O(N)
-            Worst: O(N)
-        N -> Length of graph
+            Best: O(1)
+            Worst: O(1)
         Space complexity: 
             Input: O(1)
-            Aux: O(N)
+            Aux: O(1)
         """
-        for i in self.graph:
-            print(i.vertex)
-            i.printEdges()
+        self.k = k
+        self.count = 0
+        # compactors[h] holds values that each stand for 2^h values of the stream
+        self.compactors = [[]]
+        self.size = 0
+        self.max_size = self.capacity(0)
+        self.random = random.Random()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values added to the sketch, including merged sketches
+        Input:
+            - self: Instance of the QuantileSketch class
+        Returns:
+            - Number of values summarised
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        return self.count
+
+    def capacity(self, level) -> int:
+        """
+        Returns the number of values a compactor can hold before it is compacted, which shrinks by 2/3 for each level below the top
+        Input:
+            - self: Instance of the QuantileSketch class
+            - level: Level of the compactor
+        Returns:
+            - Capacity of the compactor
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        depth = len(self.compactors) - level - 1
+        return max(2, ceil(self.k * (2 / 3) ** depth))
+
+    def add(self, value) -> None:
+        """
+        Adds a value to the sketch
+        Input:
+            - self: Instance of the QuantileSketch class
+            - value: Number to add
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(klogk) for a compaction, O(1) amortised over a stream of Ω(k) values
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        self.compactors[0].append(value)
+        self.count += 1
+        self.size += 1
+        if self.size >= self.max_size:
+            self.compress()
+
+    def compress(self) -> None:
+        """
+        Compacts the lowest full compactor, promoting every other of its sorted values to the next level with twice the weight
+        Input:
+            - self: Instance of the QuantileSketch class
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(k)
+            Worst: O(klogk)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(k)
+        """
+        for level in range(len(self.compactors)):
+            if len(self.compactors[level]) >= self.capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append([])
+                    self.max_size = sum(self.capacity(h) for h in range(len(self.compactors)))
+                compactor = self.compactors[level]
+                compactor.sort()
+                # an odd value out stays behind, and a random offset keeps the expected rank of every value unchanged
+                keep = compactor.pop() if len(compactor) % 2 else None
+                self.compactors[level + 1].extend(compactor[self.random.randint(0, 1)::2])
+                self.compactors[level] = [] if keep is None else [keep]
+                self.size = sum(len(c) for c in self.compactors)
+                break
+
+    def merge(self, other) -> None:
+        """
+        Adds every value summarised by another sketch to this one
+        Input:
+            - self: Instance of the QuantileSketch class
+            - other: QuantileSketch to merge, it is not modified
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(S)
+            Worst: O(SlogS)
+        Space complexity: 
+            Input: O(S)
+            Aux: O(S)
+        S -> number of values stored in both sketches
+        """
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level in range(len(other.compactors)):
+            self.compactors[level].extend(other.compactors[level])
+        self.count += other.count
+        self.size = sum(len(c) for c in self.compactors)
+        self.max_size = sum(self.capacity(h) for h in range(len(self.compactors)))
+        while self.size >= self.max_size:
+            self.compress()
+
+    def quantile(self, fraction):
+        """
+        Returns an approximation of the value at a given rank
+        Input:
+            - self: Instance of the QuantileSketch class
+            - fraction: Rank as a fraction of the number of values, with 0 <= fraction < 1. A fraction of (n//2)/n gives the median of find_median
+        Returns:
+            - A stored value whose rank is within about 2n/k of fraction * n
+        Time complexity: 
+            Best: O(SlogS)
+            Worst: O(SlogS)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(S)
+        S -> number of values stored in the sketch
+        """
+        if self.count == 0:
+            raise IndexError
+        weighted = []
+        for level in range(len(self.compactors)):
+            for value in self.compactors[level]:
+                weighted.append((value, 1 << level))
+        weighted.sort(key=lambda item: item[0])
+        target = fraction * self.count
+        total = 0
+        for value, weight in weighted:
+            total += weight
+            if total > target:
+                return value
+        return weighted[-1][0]
+
+def sketch_size(error):
+    """
+    Returns the k of a QuantileSketch whose rank error is about error
+    Input:
+        - error: Rank error as a fraction of the number of values, such as 0.01
+    Returns:
+        - k
+    Time Complexity:
+        Best: O(1)
+        Worst: O(1)
+    Space Complexity:
+        Best: O(1)
+        Worst: O(1)
+    """
+    return max(8, ceil(2 / error))
+
+def sketch_points(points, k):
+    """
+    Function to summarise every axis of a chunk of relevant points in one sketch per axis
+    Input:
+        - points: Non empty list of relevant points with d axes
+        - k: k of the sketches
+    Returns:
+        - sketches: List of d QuantileSketch, one per axis
+    Time Complexity:
+        Best: O(Nd)
+        Worst: O(Nd) amortised
+    Space Complexity:
+        Best: O(dk)
+        Worst: O(dk)
+    N -> number of points in the chunk
+    """
+    sketches = [QuantileSketch(k) for _ in range(len(points[0]))]
+    for point in points:
+        for axis in range(len(sketches)):
+            sketches[axis].add(point[axis])
+    return sketches
+
+def approximate_median(relevant, index, error=0.01):
+    """
+    Approximate version of find_median, which only keeps a quantile sketch of the axis instead of a copy of it
+    Input:
+        - relevant: Iterable of relevant points, which is read once
+        - index: The index of the axis in the relevant points that we want to find
+        - error: Allowed rank error of the result, as a fraction of the number of points
+    Returns:
+        - A value whose rank on the axis is within about error * N of the median
+    Time Complexity:
+        Best: O(N)
+        Worst: O(N) amortised
+    Space Complexity:
+        Best: O(1/error)
+        Worst: O(1/error)
+    N -> number of relevant points
+    """
+    sketch = QuantileSketch(sketch_size(error))
+    for point in relevant:
+        sketch.add(point[index])
+    return sketch.quantile((len(sketch) // 2) / len(sketch))
+
+def approximate_ideal_place(chunks, error=0.01, workers=1):
+    """
+    Approximate version of ideal_place for point sets that are too large for memory or are split in shards.
+    Each chunk is summarised by one sketch per axis, optionally in parallel, and the sketches are merged
+    Input:
+        - chunks: Iterable of non empty lists of relevant points, such as the shards of a dataset. Only P chunks are in memory at once
+        - error: Allowed rank error of each coordinate, as a fraction of the number of points
+        - workers: Number of worker processes that sketch the chunks, None for the number of cores
+    Returns:
+        - A location whose coordinates are within about error * N ranks of the medians used by ideal_place
+    Time Complexity:
+        Best: O(Nd/P)
+        Worst: O(Nd/P + Cdk logk)
+    Space Complexity:
+        Best: O(dk)
+        Worst: O(Pdk + P * chunk size)
+    N -> number of relevant points
+    C -> number of chunks
+    P -> number of worker processes
+    """
+    k = sketch_size(error)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    merged = None
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        if pool is None:
+            results = (sketch_points(chunk, k) for chunk in chunks)
+        else:
+            results = pool.imap_unordered(partial(sketch_points, k=k), chunks)
+        for sketches in results:
+            if merged is None:
+                merged = sketches
+            else:
+                for axis in range(len(merged)):
+                    merged[axis].merge(sketches[axis])
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    if merged is None:
+        raise IndexError
+    return [sketch.quantile((len(sketch) // 2) / len(sketch)) for sketch in merged]
+
+class MinHeap():    #MinHeap class needed for question2
+    def __init__(self, max_size: int) -> None:
+        """
+        Method to initialise the heap
+        Input:
+            - self: Instance of the MinHeap class
+            - max_size: maximum size of heap
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        self.length = 0
+        self.the_array = [0]*(max_size+1)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the heap
+        Input:
+            - self: Instance of the MinHeap class
+        Returns:
+            - Number of elements in the heap 
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        return self.length
+
+    def is_full(self) -> bool:
+        """
+        Checks if the heap is full
+        Input:
+            - self: Instance of the MinHeap class
+        Returns:
+            - True if the heap is full, else false
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        return self.length + 1 == len(self.the_array)
+
+    def rise(self, k: int) -> None:
+        """
+        Rise element at index k to its correct position
+        :precondition: 
+            - 1 <= k <= self.length
+        Input:
+            - self: Instance of the MinHeap class
+            - k: index of element
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        item = self.the_array[k]
+        while k > 1 and item[1] < self.the_array[k // 2][1]:
+            self.the_array[k] = self.the_array[k // 2]
+            k //= 2
+        self.the_array[k] = item
+
+    def add(self, element) -> bool:
+        """
+        Swaps elements while risingInput:
+        Input:
+            - self: Instance of the MinHeap class
+            - element: element to be swapped
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(N)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if self.is_full():
+            raise IndexError
+
+        self.length += 1
+        self.the_array[self.length] = element
+        self.rise(self.length)
+
+    def smallest_child(self, k: int) -> int:
+        """
+        Returns the index of k's child with greatest value.
+        :precondition: 
+            - 1 <= k <= self.length // 2
+        Input:
+            - self: Instance of the MinHeap class
+            - k: Index
+        Returns:
+            - Index of K's child with greatest value
+        Time complexity: 
+            Best: O(1)
+            Worst: O(N)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if 2 * k == self.length or \
+                self.the_array[2 * k][1] < self.the_array[2 * k + 1][1]:
+            return 2 * k
+        else:
+            return 2 * k + 1
+
+    def sink(self, k: int) -> None:
+        """ 
+        Make the element at index k sink to the correct position.
+        :precondition: 
+            - 1 <= k <= self.length // 2
+        Input:
+            - self: Instance of the MinHeap class
+            - k: index
+        Returns:
+            - Index of k's child with greatest value
+        Time complexity: 
+            Best: O(logN)
+            Worst: O(logN)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        item = self.the_array[k]
+
+        while 2 * k <= self.length:
+            min_child = self.smallest_child(k)
+            if self.the_array[min_child][1] >= item[1]:
+                break
+            self.the_array[k] = self.the_array[min_child]
+            k = min_child
+
+        self.the_array[k] = item
+        
+    def get_min(self):
+        """ 
+        Removes the minimum element from the heap and returns its value 
+        Input:
+            - self: Instance of the MinHeap class
+        Returns:
+            - minimum_value: minimum value in the heap 
+        Time complexity: 
+            Best: O(N)
+            Worst: O(N)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if self.length == 0:
+            raise IndexError
+
+        min_elt = self.the_array[1]
+        self.length -= 1
+        if self.length > 0:
+            self.the_array[1] = self.the_array[self.length+1]
+            self.sink(1)
+        return min_elt
+    
+
+    def update(self,v):
+        """
+        Updates new distance to a pre-existing vertex
+        Input:
+            - self: Instance of the MinHeap class
+            - v: vertex whose distance needs to be updated
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(N)
+            Worst: O(N)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(N)
+        """
+        for i in range(1, self.length + 1):
+            if self.the_array[i][0] == v[0]:
+                increased = v[1] > self.the_array[i][1]
+                self.the_array[i] = v
+                if increased:
+                    self.sink(i)
+                else:
+                    self.rise(i)
+                return
+    
+    def get_distance(self,v):
+        """
+        Returns the distance of a particular vertex
+        Input:
+            - self: Instance of the MinHeap class
+            - v: vertex whose distance needs to be updated
+        Returns:
+            - distance of vertex, or None if the vertex is not in the heap
+        Time complexity: 
+            Best: O(1)
+            Worst: O(N)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        for i in range(1, self.length + 1):
+            if self.the_array[i][0] == v:
+                return self.the_array[i][1]
+
+class IndexedMinHeap():
+    """
+    Binary min heap of vertices keyed by distance, with a position map from each vertex to its slot in the heap
+    so that a vertex can be found and its key decreased without searching the heap
+    """
+    def __init__(self, max_size: int) -> None:
+        """
+        Method to initialise the heap
+        Input:
+            - self: Instance of the IndexedMinHeap class
+            - max_size: number of vertices, the vertices are the integers 0 to max_size - 1
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(V)
+            Worst: O(V)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V)
+        """
+        self.length = 0
+        # parallel arrays: the heap slots hold vertices and their keys, and position[v] is the slot of vertex v or -1
+        self.vertices = array("l", [0]) * max_size
+        self.keys = array("d", [0.0]) * max_size
+        self.position = array("l", [-1]) * max_size
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vertices in the heap
+        Input:
+            - self: Instance of the IndexedMinHeap class
+        Returns:
+            - Number of vertices in the heap
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        return self.length
+
+    def contains(self, vertex: int) -> bool:
+        """
+        Checks if a vertex is in the heap
+        Input:
+            - self: Instance of the IndexedMinHeap class
+            - vertex: vertex to look for
+        Returns:
+            - True if the vertex is in the heap, else false
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        return self.position[vertex] != -1
+
+    def get_key(self, vertex: int) -> float:
+        """
+        Returns the key of a vertex in the heap
+        :precondition: 
+            - the vertex is in the heap
+        Input:
+            - self: Instance of the IndexedMinHeap class
+            - vertex: vertex whose key is returned
+        Returns:
+            - key of the vertex
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        return self.keys[self.position[vertex]]
+
+    def peek(self):
+        """
+        Returns the vertex with the smallest key and its key, without removing it
+        Input:
+            - self: Instance of the IndexedMinHeap class
+        Returns:
+            - (vertex, key) with the smallest key
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if self.length == 0:
+            raise IndexError
+        return self.vertices[0], self.keys[0]
+
+    def rise(self, k: int) -> None:
+        """
+        Rise the vertex at slot k to its correct position
+        :precondition: 
+            - 0 <= k < self.length
+        Input:
+            - self: Instance of the IndexedMinHeap class
+            - k: slot of the vertex
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(logV)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        vertices, keys, position = self.vertices, self.keys, self.position
+        vertex, key = vertices[k], keys[k]
+        while k > 0:
+            parent = (k - 1) // 2
+            if keys[parent] <= key:
+                break
+            vertices[k] = vertices[parent]
+            keys[k] = keys[parent]
+            position[vertices[k]] = k
+            k = parent
+        vertices[k] = vertex
+        keys[k] = key
+        position[vertex] = k
+
+    def sink(self, k: int) -> None:
+        """
+        Make the vertex at slot k sink to its correct position
+        :precondition: 
+            - 0 <= k < self.length
+        Input:
+            - self: Instance of the IndexedMinHeap class
+            - k: slot of the vertex
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(logV)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        vertices, keys, position = self.vertices, self.keys, self.position
+        vertex, key = vertices[k], keys[k]
+        while True:
+            child = 2 * k + 1
+            if child >= self.length:
+                break
+            if child + 1 < self.length and keys[child + 1] < keys[child]:
+                child += 1
+            if keys[child] >= key:
+                break
+            vertices[k] = vertices[child]
+            keys[k] = keys[child]
+            position[vertices[k]] = k
+            k = child
+        vertices[k] = vertex
+        keys[k] = key
+        position[vertex] = k
+
+    def add(self, vertex: int, key) -> None:
+        """
+        Adds a vertex with a key
+        :precondition: 
+            - the vertex is not in the heap
+        Input:
+            - self: Instance of the IndexedMinHeap class
+            - vertex: vertex to add
+            - key: key of the vertex
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(logV)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if self.position[vertex] != -1:
+            raise ValueError(f"vertex {vertex} is already in the heap")
+        k = self.length
+        self.length += 1
+        self.vertices[k] = vertex
+        self.keys[k] = key
+        self.position[vertex] = k
+        self.rise(k)
+
+    def decrease_key(self, vertex: int, key) -> None:
+        """
+        Lowers the key of a vertex in the heap
+        :precondition: 
+            - the vertex is in the heap and key is not greater than its current key
+        Input:
+            - self: Instance of the IndexedMinHeap class
+            - vertex: vertex whose key is lowered
+            - key: new key of the vertex
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(logV)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        k = self.position[vertex]
+        if k == -1:
+            raise KeyError(vertex)
+        self.keys[k] = key
+        self.rise(k)
+
+    def get_min(self):
+        """ 
+        Removes the vertex with the smallest key from the heap and returns it with its key
+        Input:
+            - self: Instance of the IndexedMinHeap class
+        Returns:
+            - (vertex, key) with the smallest key
+        Time complexity: 
+            Best: O(1)
+            Worst: O(logV)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if self.length == 0:
+            raise IndexError
+        vertex, key = self.vertices[0], self.keys[0]
+        self.position[vertex] = -1
+        self.length -= 1
+        if self.length > 0:
+            self.vertices[0] = self.vertices[self.length]
+            self.keys[0] = self.keys[self.length]
+            self.position[self.vertices[0]] = 0
+            self.sink(0)
+        return vertex, key
+
+class DaryHeap(IndexedMinHeap):
+    """
+    Indexed min heap where every slot has d children instead of 2, which makes the heap shallower so that
+    decrease_key moves a vertex up fewer levels, at the cost of comparing more children in get_min
+    """
+    def __init__(self, max_size: int, arity: int = 4) -> None:
+        """
+        Method to initialise the heap
+        Input:
+            - self: Instance of the DaryHeap class
+            - max_size: number of vertices, the vertices are the integers 0 to max_size - 1
+            - arity: number of children d of every slot
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(V)
+            Worst: O(V)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V)
+        """
+        super().__init__(max_size)
+        self.arity = arity
+
+    def rise(self, k: int) -> None:
+        """
+        Rise the vertex at slot k to its correct position, as in IndexedMinHeap.rise
+        Time complexity: 
+            Best: O(1)
+            Worst: O(log_d V)
+        """
+        vertices, keys, position = self.vertices, self.keys, self.position
+        vertex, key = vertices[k], keys[k]
+        while k > 0:
+            parent = (k - 1) // self.arity
+            if keys[parent] <= key:
+                break
+            vertices[k] = vertices[parent]
+            keys[k] = keys[parent]
+            position[vertices[k]] = k
+            k = parent
+        vertices[k] = vertex
+        keys[k] = key
+        position[vertex] = k
+
+    def sink(self, k: int) -> None:
+        """
+        Make the vertex at slot k sink to its correct position, as in IndexedMinHeap.sink
+        Time complexity: 
+            Best: O(1)
+            Worst: O(d log_d V)
+        """
+        vertices, keys, position = self.vertices, self.keys, self.position
+        vertex, key = vertices[k], keys[k]
+        while True:
+            first = self.arity * k + 1
+            if first >= self.length:
+                break
+            child = first
+            for i in range(first + 1, min(first + self.arity, self.length)):
+                if keys[i] < keys[child]:
+                    child = i
+            if keys[child] >= key:
+                break
+            vertices[k] = vertices[child]
+            keys[k] = keys[child]
+            position[vertices[k]] = k
+            k = child
+        vertices[k] = vertex
+        keys[k] = key
+        position[vertex] = k
+
+class PairingHeap():
+    """
+    Pairing heap of vertices keyed by distance, where every vertex is a node of a tree stored in parallel arrays.
+    add and decrease_key are O(1) and get_min is O(logV) amortised
+    """
+    def __init__(self, max_size: int) -> None:
+        """
+        Method to initialise the heap
+        Input:
+            - self: Instance of the PairingHeap class
+            - max_size: number of vertices, the vertices are the integers 0 to max_size - 1
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(V)
+            Worst: O(V)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V)
+        """
+        self.length = 0
+        self.root = -1
+        self.keys = array("d", [0.0]) * max_size
+        # child is the first child of a node, sibling the next child of the same parent,
+        # and previous is the left sibling, or the parent for a first child
+        self.child = array("l", [-1]) * max_size
+        self.sibling = array("l", [-1]) * max_size
+        self.previous = array("l", [-1]) * max_size
+        self.in_heap = bytearray(max_size)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vertices in the heap
+        """
+        return self.length
+
+    def contains(self, vertex: int) -> bool:
+        """
+        Checks if a vertex is in the heap
+        """
+        return self.in_heap[vertex] == 1
+
+    def link(self, a: int, b: int) -> int:
+        """
+        Makes the root with the larger key the first child of the other one
+        Input:
+            - self: Instance of the PairingHeap class
+            - a: root of a tree, or -1
+            - b: root of a tree, or -1
+        Returns:
+            - root of the linked tree
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if a == -1:
+            return b
+        if b == -1:
+            return a
+        if self.keys[b] < self.keys[a]:
+            a, b = b, a
+        self.sibling[b] = self.child[a]
+        if self.child[a] != -1:
+            self.previous[self.child[a]] = b
+        self.previous[b] = a
+        self.child[a] = b
+        self.sibling[a] = -1
+        self.previous[a] = -1
+        return a
+
+    def add(self, vertex: int, key) -> None:
+        """
+        Adds a vertex with a key
+        Input:
+            - self: Instance of the PairingHeap class
+            - vertex: vertex to add
+            - key: key of the vertex
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        self.keys[vertex] = key
+        self.child[vertex] = self.sibling[vertex] = self.previous[vertex] = -1
+        self.in_heap[vertex] = 1
+        self.length += 1
+        self.root = self.link(self.root, vertex)
+
+    def decrease_key(self, vertex: int, key) -> None:
+        """
+        Lowers the key of a vertex, cutting its subtree from its parent and linking it back with the root
+        Input:
+            - self: Instance of the PairingHeap class
+            - vertex: vertex whose key is lowered
+            - key: new key of the vertex
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        self.keys[vertex] = key
+        if vertex == self.root:
+            return
+        previous = self.previous[vertex]
+        if self.child[previous] == vertex:
+            self.child[previous] = self.sibling[vertex]
+        else:
+            self.sibling[previous] = self.sibling[vertex]
+        if self.sibling[vertex] != -1:
+            self.previous[self.sibling[vertex]] = previous
+        self.sibling[vertex] = self.previous[vertex] = -1
+        self.root = self.link(self.root, vertex)
+
+    def get_min(self):
+        """
+        Removes the root and merges its children in pairs from left to right, then from right to left
+        Input:
+            - self: Instance of the PairingHeap class
+        Returns:
+            - (vertex, key) with the smallest key
+        Time complexity: 
+            Best: O(1)
+            Worst: O(V), O(logV) amortised
+        Space complexity: 
+            Input: O(1)
+            Aux: O(logV) amortised
+        """
+        if self.length == 0:
+            raise IndexError
+        vertex = self.root
+        self.in_heap[vertex] = 0
+        self.length -= 1
+
+        pairs = []
+        current = self.child[vertex]
+        while current != -1:
+            second = self.sibling[current]
+            following = self.sibling[second] if second != -1 else -1
+            self.sibling[current] = self.previous[current] = -1
+            if second != -1:
+                self.sibling[second] = self.previous[second] = -1
+            pairs.append(self.link(current, second))
+            current = following
+        root = -1
+        for i in range(len(pairs) - 1, -1, -1):
+            root = self.link(pairs[i], root)
+        self.root = root
+        self.child[vertex] = -1
+        return vertex, self.keys[vertex]
+
+class RadixHeap():
+    """
+    Monotone priority queue for non negative integer keys, where a key is kept in the bucket of the highest bit in which
+    it differs from the last removed key. It relies on Dijkstra never adding a key smaller than the last removed one
+    """
+    def __init__(self, max_size: int) -> None:
+        """
+        Method to initialise the heap
+        Input:
+            - self: Instance of the RadixHeap class
+            - max_size: number of vertices, the vertices are the integers 0 to max_size - 1
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(V)
+            Worst: O(V)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V)
+        """
+        self.length = 0
+        self.last = 0
+        self.buckets = [[]]
+        # entries of a vertex whose key was decreased are left in their bucket and skipped, current holds the live key
+        self.current = [None] * max_size
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vertices in the heap
+        """
+        return self.length
+
+    def contains(self, vertex: int) -> bool:
+        """
+        Checks if a vertex is in the heap
+        """
+        return self.current[vertex] is not None
+
+    def push(self, vertex: int, key) -> None:
+        """
+        Stores an entry for a vertex in the bucket of its key
+        :precondition: 
+            - key is an integer and key >= the last removed key
+        Input:
+            - self: Instance of the RadixHeap class
+            - vertex: vertex of the entry
+            - key: key of the vertex
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1) amortised
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if key != int(key) or key < self.last:
+            raise ValueError(f"RadixHeap needs integer keys of at least {self.last}, got {key}")
+        key = int(key)
+        self.current[vertex] = key
+        bucket = (key ^ self.last).bit_length()
+        while len(self.buckets) <= bucket:
+            self.buckets.append([])
+        self.buckets[bucket].append((key, vertex))
+
+    def add(self, vertex: int, key) -> None:
+        """
+        Adds a vertex with a key, as in push
+        """
+        self.push(vertex, key)
+        self.length += 1
+
+    def decrease_key(self, vertex: int, key) -> None:
+        """
+        Lowers the key of a vertex by storing a new entry, the old one is skipped when it is reached
+        """
+        self.push(vertex, key)
+
+    def get_min(self):
+        """
+        Removes the vertex with the smallest key, redistributing the first non empty bucket around its smallest key when bucket 0 is empty
+        Input:
+            - self: Instance of the RadixHeap class
+        Returns:
+            - (vertex, key) with the smallest key
+        Time complexity: 
+            Best: O(1)
+            Worst: O(V), O(logC) amortised per entry
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        C -> largest key
+        """
+        if self.length == 0:
+            raise IndexError
+        while True:
+            if not self.buckets[0]:
+                i = 1
+                while not self.buckets[i]:
+                    i += 1
+                entries = [entry for entry in self.buckets[i] if self.current[entry[1]] == entry[0]]
+                self.buckets[i] = []
+                if not entries:
+                    continue
+                self.last = min(entries)[0]
+                for key, vertex in entries:
+                    self.buckets[(key ^ self.last).bit_length()].append((key, vertex))
+            key, vertex = self.buckets[0].pop()
+            if self.current[vertex] == key:
+                self.current[vertex] = None
+                self.length -= 1
+                return vertex, key
+
+class BucketQueue():
+    """
+    Dial's bucket queue for integer keys of Dijkstra with integer weights of at most C: the live keys always lie in
+    a range of C + 1 values, so they are kept in a circular array of C + 1 buckets scanned in order
+    """
+    def __init__(self, max_size: int, max_weight: int) -> None:
+        """
+        Method to initialise the queue
+        Input:
+            - self: Instance of the BucketQueue class
+            - max_size: number of vertices, the vertices are the integers 0 to max_size - 1
+            - max_weight: largest edge weight C
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(V + C)
+            Worst: O(V + C)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V + C)
+        """
+        self.length = 0
+        self.cursor = 0
+        self.buckets = [[] for _ in range(int(max_weight) + 1)]
+        self.current = [None] * max_size
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vertices in the queue
+        """
+        return self.length
+
+    def contains(self, vertex: int) -> bool:
+        """
+        Checks if a vertex is in the queue
+        """
+        return self.current[vertex] is not None
+
+    def push(self, vertex: int, key) -> None:
+        """
+        Stores an entry for a vertex in the bucket of its key
+        :precondition: 
+            - key is an integer with cursor <= key <= cursor + C
+        Input:
+            - self: Instance of the BucketQueue class
+            - vertex: vertex of the entry
+            - key: key of the vertex
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if key != int(key) or not self.cursor <= key < self.cursor + len(self.buckets):
+            raise ValueError(f"BucketQueue needs integer keys from {self.cursor} to {self.cursor + len(self.buckets) - 1}, got {key}")
+        key = int(key)
+        self.current[vertex] = key
+        self.buckets[key % len(self.buckets)].append(vertex)
+
+    def add(self, vertex: int, key) -> None:
+        """
+        Adds a vertex with a key, as in push
+        """
+        self.push(vertex, key)
+        self.length += 1
+
+    def decrease_key(self, vertex: int, key) -> None:
+        """
+        Lowers the key of a vertex by storing a new entry, the old one is skipped when it is reached
+        """
+        self.push(vertex, key)
+
+    def get_min(self):
+        """
+        Removes a vertex with the smallest key, moving the cursor forward over empty buckets
+        Input:
+            - self: Instance of the BucketQueue class
+        Returns:
+            - (vertex, key) with the smallest key
+        Time complexity: 
+            Best: O(1)
+            Worst: O(C), O(1) amortised over a run of Dijkstra with keys up to D, plus O(D) in total
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        if self.length == 0:
+            raise IndexError
+        while True:
+            bucket = self.buckets[self.cursor % len(self.buckets)]
+            while bucket:
+                vertex = bucket.pop()
+                if self.current[vertex] == self.cursor:
+                    self.current[vertex] = None
+                    self.length -= 1
+                    return vertex, self.cursor
+            self.cursor += 1
+
+class TupleMinHeapQueue():
+    """
+    Adapter that lets the original MinHeap of (vertex, distance) tuples be used as a queue by RoadGraph.dijkstra
+    """
+    def __init__(self, max_size: int) -> None:
+        """
+        Method to initialise the queue
+        """
+        self.heap = MinHeap(max_size)
+        self.in_heap = bytearray(max_size)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vertices in the queue
+        """
+        return len(self.heap)
+
+    def contains(self, vertex: int) -> bool:
+        """
+        Checks if a vertex is in the queue
+        """
+        return self.in_heap[vertex] == 1
+
+    def add(self, vertex: int, key) -> None:
+        """
+        Adds a vertex with a key
+        """
+        self.in_heap[vertex] = 1
+        self.heap.add((vertex, key))
+
+    def decrease_key(self, vertex: int, key) -> None:
+        """
+        Lowers the key of a vertex with MinHeap.update, which searches the heap for it
+        """
+        self.heap.update((vertex, key))
+
+    def get_min(self):
+        """
+        Removes the vertex with the smallest key and returns it with its key
+        """
+        vertex, key = self.heap.get_min()
+        self.in_heap[vertex] = 0
+        return vertex, key
+
+# Priority queues accepted by RoadGraph.dijkstra, each made from the number of vertices and the largest edge weight
+PRIORITY_QUEUES = {
+    "binary": lambda size, max_weight: IndexedMinHeap(size),
+    "dary": lambda size, max_weight: DaryHeap(size),
+    "pairing": lambda size, max_weight: PairingHeap(size),
+    "radix": lambda size, max_weight: RadixHeap(size),
+    "bucket": lambda size, max_weight: BucketQueue(size, max_weight),
+    "minheap": lambda size, max_weight: TupleMinHeapQueue(size),
+}
+
+class Node: # Node class needed for question 2
+    """
+    Implementation of a generic node class. The state of a traversal is kept by the traversal itself, not on the nodes,
+    so that several queries can share one graph
+    """
+    __slots__ = ("vertex", "edges")
+
+    def __init__(self,value):
+        """
+        Function to initialise the node object
+        Input:
+            - self: Instance of the Node class
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(1)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        self.vertex = value
+        self.edges = []
+    
+    def printEdges(self):
+        """
+        Function to print each edge along with its weight
+        Input:
+            - self: Instance of the Node class
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(E)
+            Worst: O(E)
+        E -> Number of edges
+        Space complexity: 
+            Input: O(1)
+            Aux: O(E)
+        """
+        for i in self.edges:
+            print(f"Edge to {str(i.v)} with a weight of {str(i.w)}")
+            
+class Edge: # Edge class needed for question 2
+    """
+    Class for edge data
+    """
+    __slots__ = ("u", "v", "w")
+
+    def __init__(self,u,v,w):
+        """
+        Function to initialise the edge object
+        """
+        self.u = u
+        self.v = v
+        self.w = w
+
+class RoadGraph:
+    def __init__(self,roads,lean=False):
+        """
+        Function to initialise the RoadGraph object. Besides the Node objects, the roads leaving every location are kept
+        in compressed sparse row form: the roads leaving u are targets[offsets[u]:offsets[u+1]] with distances
+        weights[offsets[u]:offsets[u+1]]
+        Input:
+            - self: Instance of the Node class
+            - roads: A list of roads roads represted as a list of tuples (u, v, w), u is the starting location ID for a road, 
+              v is the ending location ID for a road, w is the distance along that road,
+            - lean: If True, only the CSR arrays are built and self.graph is None
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(V+N)
+            Worst: O(V+N)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V+N)
+        """
+        max_vertex= roads[0][0]
+        self.max_weight = 0
+        integral = True
+        for i in range(len(roads)):
+            if roads[i][0] > max_vertex:
+                max_vertex = roads[i][0]
+            if roads[i][1] > max_vertex:
+                max_vertex = roads[i][1]
+            if roads[i][2] > self.max_weight:
+                self.max_weight = roads[i][2]
+            if integral and not isinstance(roads[i][2], int):
+                integral = False
+        self.V = max_vertex
+        self.lean = lean
+        self.createCSR(roads, integral)
+        # the roads entering every location, built by reverseCSR the first time a bidirectional search needs them
+        self.reverse_offsets = self.reverse_sources = self.reverse_weights = None
+        if lean:
+            self.graph = None
+        else:
+            self.graph = [None] * (self.V+1)
+            self.createGraph(roads)
+
+    def createCSR(self,roads,integral=False):
+        """
+        Function to store the roads in compressed sparse row form, placing them with a counting sort on their starting location
+        Input:
+            - self: Instance of the RoadGraph class
+            - roads: A list of roads roads represted as a list of tuples (u, v, w)
+            - integral: True if every distance is an integer, so that they are stored as 64 bit integers instead of floats
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(V+N)
+            Worst: O(V+N)
+        N -> Length of roads list
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V+N)
+        """
+        size = self.V + 1
+        offsets = array("l", [0]) * (size + 1)
+        for road in roads:
+            offsets[road[0] + 1] += 1
+        for u in range(size):
+            offsets[u + 1] += offsets[u]
+
+        # next_slot[u] is where the next road leaving u goes, so roads keep their input order within a location
+        next_slot = array("l", offsets)
+        targets = array("l", [0]) * len(roads)
+        weights = array("q" if integral else "d", [0]) * len(roads)
+        for u, v, w in roads:
+            slot = next_slot[u]
+            targets[slot] = v
+            weights[slot] = w
+            next_slot[u] = slot + 1
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    def reverseCSR(self):
+        """
+        Function to store the roads entering every location in compressed sparse row form, with a counting sort of the CSR
+        arrays on the ending location: the roads entering v come from reverse_sources[reverse_offsets[v]:reverse_offsets[v+1]]
+        Input:
+            - self: Instance of the RoadGraph class
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1) once the arrays exist
+            Worst: O(V+N)
+        N -> Length of roads list
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V+N)
+        """
+        if self.reverse_offsets is not None:
+            return
+        size = self.V + 1
+        offsets = array("l", [0]) * (size + 1)
+        for v in self.targets:
+            offsets[v + 1] += 1
+        for v in range(size):
+            offsets[v + 1] += offsets[v]
+
+        next_slot = array("l", offsets)
+        sources = array("l", [0]) * len(self.targets)
+        weights = array(self.weights.typecode, [0]) * len(self.targets)
+        for u in range(size):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[i]
+                slot = next_slot[v]
+                sources[slot] = u
+                weights[slot] = self.weights[i]
+                next_slot[v] = slot + 1
+        self.reverse_sources = sources
+        self.reverse_weights = weights
+        self.reverse_offsets = offsets
+
+    def createQueue(self, queue):
+        """
+        Function to make an empty priority queue over the locations of the graph
+        Input:
+            - self: Instance of the RoadGraph class
+            - queue: Name of a priority queue in PRIORITY_QUEUES, or a function making a queue from the number of vertices and
+              the largest edge weight
+        Returns:
+            - An empty priority queue
+        Time complexity: 
+            Best: O(V)
+            Worst: O(V + C) with "bucket"
+        C -> largest edge weight
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V)
+        """
+        if isinstance(queue, str):
+            if queue not in PRIORITY_QUEUES:
+                raise ValueError(f"unknown priority queue {queue!r}, expected one of {', '.join(PRIORITY_QUEUES)}")
+            queue = PRIORITY_QUEUES[queue]
+        return queue(self.V + 1, self.max_weight)
+
+    def createGraph(self,roads):
+        """
+        Function to create graph using the starting location, ending location and distance givwn in the roads list
+        Input:
+            - self: Instance of the Node class
+            - roads: A list of roads roads represted as a list of tuples (u, v, w), u is the starting location ID for a road, 
+              v is the ending location ID for a road, w is the distance along that road,
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(1)
+            Worst: O(V*N)
+        N -> Length of roads list
+        Space complexity: 
+            Input: O(1)
+            Aux: O(E)
+        """
+        for j in range(self.V+1):
+            self.graph[j] = (Node(j))
+        for k in roads:
+            self.graph[k[0]].edges.append(Edge(k[0],k[1],k[2]))
+
+    def printGraph(self):
+        """
+        Function to print each vertex in the graph, reading its roads from the CSR arrays so that it also works on a lean graph
+        Input:
+            - self: Instance of the Node class
+        Returns:
+            - None
+        Time complexity: 
+            Best: O(V+E)
+            Worst: O(V+E)
+        Space complexity: 
+            Input: O(1)
+            Aux: O(1)
+        """
+        for u in range(self.V + 1):
+            print(u)
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                print(f"Edge to {str(self.targets[i])} with a weight of {str(self.weights[i])}")
     
-    def dijkstra(self, start):
+    def dijkstra(self, start, queue="binary"):
         """
         Function to implement Djikstra's algorithm
         Precondition: 
@@ -515,52 +2003,187 @@ class RoadGraph:
             - Shortest distance should be returned
         Input:
             - start: Integer that represents the starting location of your journey. Your route must begin from this location.
+            - queue: Name of a priority queue in PRIORITY_QUEUES, or a function making a queue from the number of vertices and
+              the largest edge weight. "radix" and "bucket" need integer weights
         Return:
-            - distance: Shortest distance from starting point to all other points
-            - vertices: Vertex that has the least distance value
-        Time complexity: 
-            Best: O(V^2) 
-            Worst: O(ElogV)
-        where E is the set roads and V is the set of unique locations in roads
-        Space complexity: 
-            Input: O(1)
-            Aux: O(|V|+|E|)
-        """
-        vert = start
-        discover_queue = MinHeap(self.V)
-        discover_queue.add((vert,0,0))
-        distances = [(float("inf"),0)]*(self.V)
-        vertices = [None] * (self.V)
-        for i in range(len(vertices)):
-            vertices[i] = []
-        distances[vert] = (0,0)
-
-        while discover_queue.length != 0:
-            min = discover_queue.get_min()
-            self.graph[min[0]].visited = True
-            count = 0
-            for edge in self.graph[min[0]].edges:
-                if self.graph[edge.v].visited != True:
-                    if self.graph[edge.v].discovered == False:
-                        discover_queue.add((edge.v,min[1]+edge.w))
-                        distances[count] = (min[1]+edge.w,edge.v)
-                        vertices[count].append(min[1])
-                        self.graph[edge.v].discovered = True
-                    elif distances[edge.v][0] > min[1]+edge.w:
-                        discover_queue.update((edge.v,min[1]+edge.w))
-                        distances[count] = (min[1]+edge.w,edge.v)
-                        vertices[count].append(min[1])
-                        self.graph[edge.v].discovered = True
-
-                count = count + 1
-        #reset status of vertices      
-        for vert in self.graph:
-            vert.discovered = False
-            vert.visited = False
-
-        print(distances)
+            - distances: distances[v] is (shortest distance from starting point to v, v), with a distance of inf if v cannot be reached
+            - vertices: vertices[v] is the vertex before v on a shortest path from the starting point, or None for the start and unreachable vertices
+        Time complexity: 
+            Best: O(V) 
+            Worst: O((V+E)logV) with "binary"
+        where E is the set roads and V is the set of unique locations in roads. The roads leaving a location are read from the CSR arrays
+        Space complexity: 
+            Input: O(1)
+            Aux: O(|V|)
+        """
+        distance, vertices = self.search(start, queue)
+        distances = [(distance[v], v) for v in range(self.V + 1)]
         return distances, vertices
 
+    def search(self, start, queue="binary", end=None):
+        """
+        Function to run Djikstra's algorithm from a location, stopping early once end is settled if it is given
+        Input:
+            - start: Integer that represents the starting location
+            - queue: Name of a priority queue in PRIORITY_QUEUES, or a function making a queue, as in dijkstra
+            - end: Location whose distance is needed, or None to settle every location
+        Return:
+            - distance: distance[v] is the shortest distance from start to v, or inf if v cannot be reached. Only final for
+              the locations settled before end
+            - vertices: vertices[v] is the vertex before v on a shortest path from start, or None
+        Time complexity: 
+            Best: O(V) 
+            Worst: O((V+E)logV) with "binary"
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V)
+        """
+        graph = (self.offsets, self.targets, self.weights)
+        size = self.V + 1
+        distance = [float("inf")] * size
+        vertices = [None] * size
+        distance[start] = 0
+        discover_queue = self.createQueue(queue)
+        discover_queue.add(start, 0)
+
+        # every vertex leaves the queue once, with its final distance, since a shorter path found later only lowers its key
+        while len(discover_queue) != 0:
+            u, _ = discover_queue.get_min()
+            if u == end:
+                break
+            self.relax(u, graph, distance, vertices, discover_queue)
+        return distance, vertices
+
+    def relax(self, u, graph, distance, vertices, discover_queue):
+        """
+        Function to relax every road leaving a settled location, lowering the distance of the locations they reach
+        Input:
+            - u: Settled location
+            - graph: (offsets, targets, weights) CSR arrays to read the roads from, forwards or reversed
+            - distance: Distances found so far, updated in place
+            - vertices: Vertex before every location on its best path so far, updated in place
+            - discover_queue: Priority queue of the locations that have been found but not settled, updated in place
+        Return:
+            - improved: List of the locations whose distance was lowered
+        Time complexity: 
+            Best: O(D)
+            Worst: O(DlogV) with "binary"
+        D -> Number of roads leaving u
+        Space complexity: 
+            Input: O(V)
+            Aux: O(D)
+        """
+        offsets, targets, weights = graph
+        improved = []
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            new_distance = distance[u] + weights[i]
+            if new_distance < distance[v]:
+                distance[v] = new_distance
+                vertices[v] = u
+                improved.append(v)
+                if discover_queue.contains(v):
+                    discover_queue.decrease_key(v, new_distance)
+                else:
+                    discover_queue.add(v, new_distance)
+        return improved
+
+    def shortest_path(self, start, end, bidirectional=False, queue="binary"):
+        """
+        Function to find a shortest route from one location to another, stopping as soon as the distance to end is known
+        instead of settling the whole graph like dijkstra.
+        The bidirectional search runs dijkstra forwards from start and backwards from end over the reverse CSR arrays, always
+        advancing the side whose last settled distance is smaller. mu is the length of the shortest route found through a
+        location labelled by both sides, and the search stops once the last settled distances of the two sides add up to mu,
+        since any shorter route would have to go through a location that neither side has settled yet
+        Precondition: 
+            - Weight of the edges has to be non negative
+        Input:
+            - start: Integer that represents the starting location of your journey
+            - end: Integer that represents the ending location of your journey
+            - bidirectional: If True, search from both ends at once
+            - queue: Name of a priority queue in PRIORITY_QUEUES, or a function making a queue, as in dijkstra
+        Return:
+            - distance: length of a shortest route from start to end, or inf if end cannot be reached
+            - path: list of the locations on that route, from start to end, or [] if end cannot be reached
+        Time complexity: 
+            Best: O(V)
+            Worst: O((V+E)logV) with "binary", plus O(V+E) the first time a bidirectional search builds the reverse CSR arrays
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V)
+        """
+        if start == end:
+            return 0, [start]
+        if bidirectional:
+            return self.bidirectional_search(start, end, queue)
+
+        distance, vertices = self.search(start, queue, end)
+        if distance[end] == float("inf"):
+            return distance[end], []
+        path = [end]
+        while path[-1] != start:
+            path.append(vertices[path[-1]])
+        path.reverse()
+        return distance[end], path
+
+    def bidirectional_search(self, start, end, queue="binary"):
+        """
+        Function to run the bidirectional search of shortest_path
+        Precondition: 
+            - start != end
+        Input:
+            - start: Integer that represents the starting location of your journey
+            - end: Integer that represents the ending location of your journey
+            - queue: Name of a priority queue in PRIORITY_QUEUES, or a function making a queue, as in dijkstra
+        Return:
+            - distance: length of a shortest route from start to end, or inf if end cannot be reached
+            - path: list of the locations on that route, from start to end, or [] if end cannot be reached
+        Time complexity: 
+            Best: O(V)
+            Worst: O((V+E)logV) with "binary"
+        Space complexity: 
+            Input: O(1)
+            Aux: O(V)
+        """
+        self.reverseCSR()
+        size = self.V + 1
+        # index 0 is the search forwards from start, index 1 the search backwards from end
+        graphs = ((self.offsets, self.targets, self.weights),
+                  (self.reverse_offsets, self.reverse_sources, self.reverse_weights))
+        distances = ([float("inf")] * size, [float("inf")] * size)
+        vertices = ([None] * size, [None] * size)
+        queues = (self.createQueue(queue), self.createQueue(queue))
+        last = [0, 0]
+        distances[0][start] = 0
+        distances[1][end] = 0
+        queues[0].add(start, 0)
+        queues[1].add(end, 0)
+        mu = float("inf")
+        meeting = None
+
+        # once one side runs out of locations, every route it could extend has been seen, so mu is final
+        while len(queues[0]) != 0 and len(queues[1]) != 0:
+            side = 0 if last[0] <= last[1] else 1
+            u, last[side] = queues[side].get_min()
+            if last[0] + last[1] >= mu:
+                break
+            distance, other = distances[side], distances[1 - side]
+            for v in self.relax(u, graphs[side], distance, vertices[side], queues[side]):
+                if distance[v] + other[v] < mu:
+                    mu = distance[v] + other[v]
+                    meeting = v
+
+        if meeting is None:
+            return mu, []
+        path = [meeting]
+        while path[-1] != start:
+            path.append(vertices[0][path[-1]])
+        path.reverse()
+        while path[-1] != end:
+            path.append(vertices[1][path[-1]])
+        return mu, path
+
     def routing(self,start,end,chores_location):
         """
         Function to return the shortest route from the start location to the end location, going through at least 1 of the locations listed in chores_location.
@@ -0,0 +1,218 @@
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from assignment1 import (NumpyWordIndex, WordIndex, WordStore, counting_sort, get_words, np,
+                         radix_sort_string, trainer, word_sort, write_word_store)
+
+def make_wordlist(size, length, rng):
+    """
+    Function that generates a synthetic dictionary of distinct random words
+    Precondition:
+        - size <= 26^length
+    Input:
+        size: Number of words N to generate
+        length: Length M of each word
+        rng: random.Random instance used to generate the words
+    Return:
+        wordlist: List of N distinct words of length M, in random order
+    Time complexity:
+        Best: O(NM)
+        Worst: O(NM) expected
+    Space complexity:
+        Input: O(1)
+        Aux: O(NM)
+    """
+    if size > 26 ** length:
+        raise ValueError(f"cannot make {size} distinct words of length {length}")
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(letters, k=length)))
+    wordlist = list(words)
+    rng.shuffle(wordlist)
+    return wordlist
+
+def make_queries(wordlist, count, rng):
+    """
+    Function that generates a fixed mix of (word, marker) queries against a dictionary
+    Input:
+        wordlist: List of N words of length M
+        count: Number of queries Q to generate
+        rng: random.Random instance used to generate the queries
+    Return:
+        queries: List of Q (word, marker) pairs. A third of them carry the real feedback against a word of the list,
+                 a third carry a random marker and a third carry an all zero marker
+    Time complexity:
+        Best: O(QM)
+        Worst: O(QM)
+    Space complexity:
+        Input: O(N)
+        Aux: O(QM)
+    """
+    length = len(wordlist[0])
+    queries = []
+    for i in range(count):
+        word = rng.choice(wordlist)
+        if i % 3 == 0:
+            # the guess is scored against a shuffled copy of itself, so that some words of the list are possible matches
+            answer = list(word)
+            rng.shuffle(answer)
+            marker = [1 if word[j] == answer[j] else 0 for j in range(length)]
+        elif i % 3 == 1:
+            marker = [rng.randint(0, 1) for _ in range(length)]
+        else:
+            marker = [0] * length
+        queries.append((word, marker))
+    return queries
+
+def percentile(ordered, fraction):
+    """
+    Function that returns a percentile of a sorted list of samples, using the nearest rank
+    Input:
+        ordered: Non empty list of samples in ascending order
+        fraction: Percentile as a fraction in the range [0, 1]
+    Return:
+        The sample at that percentile
+    Time complexity:
+        Best: O(1)
+        Worst: O(1)
+    Space complexity:
+        Input: O(1)
+        Aux: O(1)
+    """
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def measure(operation, queries, prepare):
+    """
+    Function that runs an operation once per query and reports its latency, throughput and peak memory
+    Input:
+        operation: Function to benchmark
+        queries: List of K (word, marker) queries
+        prepare: Function turning a query into the argument tuple of operation. It is called outside of the timed region,
+                 so that only one copy of the word list is alive at a time
+    Return:
+        report: Dictionary with the number of calls, the latency percentiles in milliseconds,
+                the number of calls per second and the peak traced memory of one call in bytes
+    Time complexity:
+        Best: O(K) calls of operation
+        Worst: O(K) calls of operation
+    Space complexity:
+        Input: O(K)
+        Aux: O(K)
+    """
+    latencies = []
+    for query in queries:
+        args = prepare(*query)
+        start = time.perf_counter()
+        operation(*args)
+        latencies.append(time.perf_counter() - start)
+        del args
+
+    # memory is traced in a separate call, since tracemalloc slows down every allocation
+    args = prepare(*queries[0])
+    tracemalloc.start()
+    operation(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "calls": len(latencies),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p90_ms": percentile(latencies, 0.90) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "throughput_per_s": len(latencies) / total if total else None,
+        "peak_memory_bytes": peak,
+    }
+
+def run_case(size, length, query_count, backends, rng):
+    """
+    Function that benchmarks every stage and backend on one synthetic dictionary
+    Input:
+        size: Number of words N in the dictionary
+        length: Length M of each word
+        query_count: Number of queries Q per stage
+        backends: Names of the backends to compare, out of "trainer", "index", "numpy" and "store"
+        rng: random.Random instance used to generate the dictionary and the queries
+    Return:
+        case: Dictionary with the parameters of the case, the time to build each backend and a report per stage
+    """
+    wordlist = make_wordlist(size, length, rng)
+    queries = make_queries(wordlist, query_count, rng)
+    # every stage that narrows the list in place receives its own copy of it
+    stages = {
+        "counting_sort": measure(counting_sort, queries, lambda word, marker: (word,)),
+        "word_sort": measure(word_sort, queries, lambda word, marker: (list(wordlist), word[0], 0, marker[0] == 1)),
+        "radix_sort_string": measure(radix_sort_string, queries, lambda word, marker: (list(wordlist), word, marker)),
+        "get_words": measure(get_words, queries, lambda word, marker: (word, wordlist)),
+    }
+    build = {}
+
+    if "trainer" in backends:
+        stages["trainer"] = measure(trainer, queries, lambda word, marker: (list(wordlist), word, marker))
+    if "index" in backends:
+        start = time.perf_counter()
+        index = WordIndex(wordlist)
+        build["index_s"] = time.perf_counter() - start
+        stages["index"] = measure(index.trainer, queries, lambda word, marker: (word, marker))
+        del index
+    if "numpy" in backends and np is not None:
+        start = time.perf_counter()
+        numpy_index = NumpyWordIndex(wordlist)
+        build["numpy_s"] = time.perf_counter() - start
+        stages["numpy"] = measure(numpy_index.trainer, queries, lambda word, marker: (word, marker))
+        del numpy_index
+    if "store" in backends:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "words.store")
+            write_word_store(path, wordlist)
+            start = time.perf_counter()
+            store = WordStore(path)
+            build["store_s"] = time.perf_counter() - start
+            stages["store"] = measure(store.trainer, queries, lambda word, marker: (word, marker))
+            store.close()
+
+    return {"words": size, "length": length, "queries": query_count, "build": build, "stages": stages}
+
+def main(argv=None):
+    """
+    Function that runs the benchmark from the command line and prints the report as JSON
+    Input:
+        argv: Command line arguments, defaults to sys.argv[1:]
+    Return:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the word filtering of assignment1 on synthetic dictionaries")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="number of words per dictionary")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[5, 10, 15], help="length of the words")
+    parser.add_argument("--queries", type=int, default=30, help="number of queries per stage")
+    parser.add_argument("--backends", nargs="+", default=["trainer", "index", "numpy", "store"],
+                        choices=["trainer", "index", "numpy", "store"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to write the JSON report to, instead of standard output")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    report = {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__ if np is not None else None,
+        "seed": args.seed,
+        "cases": [run_case(size, length, args.queries, args.backends, rng) for length in args.lengths for size in args.sizes],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import argparse
+import json
+import random
+import sys
+import time
+
+from assignment2 import PRIORITY_QUEUES, RoadGraph
+
+def make_grid(side, max_weight, rng):
+    """
+    Function that generates a road network shaped like a city grid, with a road both ways between neighbouring crossings
+    Input:
+        side: Number of crossings S along each side of the grid
+        max_weight: Largest road distance C, distances are random integers from 1 to C
+        rng: random.Random instance used to generate the distances
+    Return:
+        roads: List of about 4S^2 (u, v, w) roads between S^2 locations
+    Time complexity:
+        Best: O(S^2)
+        Worst: O(S^2)
+    Space complexity:
+        Input: O(1)
+        Aux: O(S^2)
+    """
+    roads = []
+    for row in range(side):
+        for column in range(side):
+            u = row * side + column
+            if column + 1 < side:
+                w = rng.randint(1, max_weight)
+                roads.append((u, u + 1, w))
+                roads.append((u + 1, u, w))
+            if row + 1 < side:
+                w = rng.randint(1, max_weight)
+                roads.append((u, u + side, w))
+                roads.append((u + side, u, w))
+    return roads
+
+def make_sparse(size, degree, max_weight, rng):
+    """
+    Function that generates a random sparse road network, on top of a cycle so that every location can be reached
+    Input:
+        size: Number of locations V
+        degree: Average number of roads D leaving a location
+        max_weight: Largest road distance C, distances are random integers from 1 to C
+        rng: random.Random instance used to generate the roads
+    Return:
+        roads: List of VD (u, v, w) roads
+    Time complexity:
+        Best: O(VD)
+        Worst: O(VD)
+    Space complexity:
+        Input: O(1)
+        Aux: O(VD)
+    """
+    roads = [(u, (u + 1) % size, rng.randint(1, max_weight)) for u in range(size)]
+    for _ in range(size * (degree - 1)):
+        roads.append((rng.randrange(size), rng.randrange(size), rng.randint(1, max_weight)))
+    return roads
+
+def run_case(shape, roads, pairs, queues):
+    """
+    Function that times RoadGraph.dijkstra with every priority queue on one road network, then compares a full dijkstra
+    with the point to point searches of RoadGraph.shortest_path
+    Input:
+        shape: Name of the network shape, reported as is
+        roads: List of (u, v, w) roads
+        pairs: List of (start, end) locations, every queue runs dijkstra once from each start
+        queues: Names of the priority queues to compare, out of PRIORITY_QUEUES
+    Return:
+        case: Dictionary with the size of the network, the time to build the graph, the mean and best time per query of every queue
+              and the mean time per query of every point to point mode with the first queue
+    """
+    sources = [start for start, _ in pairs]
+    start = time.perf_counter()
+    graph = RoadGraph(roads, lean=True)
+    build = time.perf_counter() - start
+
+    timings = {}
+    expected = {}
+    for queue in queues:
+        latencies = []
+        for source in sources:
+            start = time.perf_counter()
+            distances, _ = graph.dijkstra(source, queue)
+            latencies.append(time.perf_counter() - start)
+            # every queue has to agree with the first one, or its timing is meaningless
+            if expected.setdefault(source, distances) != distances:
+                raise AssertionError(f"{queue} disagrees with {queues[0]} from {source}")
+        timings[queue] = {"mean_ms": sum(latencies) / len(latencies) * 1000, "best_ms": min(latencies) * 1000}
+
+    # the reverse CSR arrays are built outside of the timed region, as they are shared by every bidirectional query
+    graph.reverseCSR()
+    modes = {
+        "dijkstra": lambda start, end: graph.dijkstra(start, queues[0])[0][end][0],
+        "shortest_path": lambda start, end: graph.shortest_path(start, end, False, queues[0])[0],
+        "bidirectional": lambda start, end: graph.shortest_path(start, end, True, queues[0])[0],
+    }
+    paths = {}
+    for mode, search in modes.items():
+        total = 0
+        for start, end in pairs:
+            begin = time.perf_counter()
+            distance = search(start, end)
+            total += time.perf_counter() - begin
+            if expected[start][end][0] != distance:
+                raise AssertionError(f"{mode} disagrees with dijkstra from {start} to {end}")
+        paths[mode] = {"mean_ms": total / len(pairs) * 1000}
+    return {"shape": shape, "vertices": graph.V + 1, "roads": len(roads), "build_s": build, "queues": timings, "paths": paths}
+
+def main(argv=None):
+    """
+    Function that runs the benchmark from the command line and prints the report as JSON
+    Input:
+        argv: Command line arguments, defaults to sys.argv[1:]
+    Return:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the priority queues of RoadGraph.dijkstra on synthetic road networks")
+    parser.add_argument("--sides", type=int, nargs="+", default=[30, 100], help="number of crossings along each side of the grids")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="number of locations of the sparse networks")
+    parser.add_argument("--degree", type=int, default=4, help="average number of roads leaving a location of the sparse networks")
+    parser.add_argument("--max-weight", type=int, default=100, help="largest road distance")
+    parser.add_argument("--sources", type=int, default=5, help="number of (start, end) pairs per network")
+    parser.add_argument("--queues", nargs="+", default=[name for name in PRIORITY_QUEUES if name != "minheap"],
+                        choices=list(PRIORITY_QUEUES), help="the O(V) update of minheap makes it slow on large networks")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to write the JSON report to, instead of standard output")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    cases = []
+    for side in args.sides:
+        roads = make_grid(side, args.max_weight, rng)
+        pairs = [(rng.randrange(side * side), rng.randrange(side * side)) for _ in range(args.sources)]
+        cases.append(run_case("grid", roads, pairs, args.queues))
+    for size in args.sizes:
+        roads = make_sparse(size, args.degree, args.max_weight, rng)
+        pairs = [(rng.randrange(size), rng.randrange(size)) for _ in range(args.sources)]
+        cases.append(run_case("sparse", roads, pairs, args.queues))
+
+    report = {"python": sys.version.split()[0], "seed": args.seed, "max_weight": args.max_weight, "cases": cases}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()